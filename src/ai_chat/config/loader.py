@@ -17,12 +17,17 @@ from .models import Config
 logger = logging.getLogger(__name__)
 
 
-def get_config_search_paths(custom_path: Optional[str] = None) -> list[Path]:
+def get_config_search_paths(
+    custom_path: Optional[str] = None,
+    search_dirs: Optional[list[Path]] = None,
+) -> list[Path]:
     """
     Get list of configuration file paths to search, in priority order.
 
     Args:
         custom_path: Optional custom config path (highest priority)
+        search_dirs: Optional directories containing models.toml to search
+            instead of the default locations
 
     Returns:
         List of Path objects to search
@@ -33,6 +38,10 @@ def get_config_search_paths(custom_path: Optional[str] = None) -> list[Path]:
     if custom_path:
         paths.append(Path(custom_path).expanduser().resolve())
 
+    if search_dirs is not None:
+        paths.extend(Path(d) / "models.toml" for d in search_dirs)
+        return paths
+
     # 2. Current directory
     paths.append(Path.cwd() / "config" / "models.toml")
 
@@ -43,7 +52,10 @@ def get_config_search_paths(custom_path: Optional[str] = None) -> list[Path]:
     return paths
 
 
-def load_config(config_path: Optional[str] = None) -> Config:
+def load_config(
+    config_path: Optional[str] = None,
+    search_dirs: Optional[list[Path]] = None,
+) -> Config:
     """
     Load and validate configuration from TOML file.
 
@@ -54,6 +66,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
 
     Args:
         config_path: Optional path to config file
+        search_dirs: Optional directories to search instead of 2 and 3
 
     Returns:
         Validated Config object
@@ -63,7 +76,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
         ValidationError: If config validation fails
         ValueError: If TOML parsing fails
     """
-    search_paths = get_config_search_paths(config_path)
+    search_paths = get_config_search_paths(config_path, search_dirs)
 
     # Find first existing config file
     config_file = None
@@ -7,13 +7,19 @@ from typing import Optional, Any
 from .types import SourceType, FormatHint
 
 
-@dataclass
+def _default_now() -> str:
+    """Return the current local time as an ISO 8601 string."""
+    return datetime.now().isoformat()
+
+
+@dataclass(slots=True)
 class Provenance:
     """Provenance information for captured content."""
 
     source_id: str
     source_name: str
-    captured_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Looked up at call time so tests can substitute a fixed clock
+    captured_at: str = field(default_factory=lambda: _default_now())
     extra: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
@@ -26,7 +32,7 @@ class Provenance:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CapturePayload:
     """Payload for captured content."""
 
@@ -16,7 +16,7 @@ class SourceCapabilities:
     supports_attachments: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceContext:
     """
     Context provided to sources with callbacks to host application.
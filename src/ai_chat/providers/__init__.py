@@ -1,5 +1,6 @@
 """AI provider implementations."""
 
+import importlib
 import logging
 
 from ai_chat.config.models import ModelConfig, ProviderType
@@ -13,8 +14,6 @@ from .base import (
     RateLimitError,
     StreamChunk,
 )
-from .bedrock import BedrockProvider
-from .openai_compatible import OpenAICompatibleProvider
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +28,30 @@ __all__ = [
     "create_provider",
 ]
 
+# Provider type -> (module, class name, label for logging). Modules are
+# imported on demand so boto3 is only loaded for Bedrock.
+_PROVIDER_CLASSES = {
+    ProviderType.BEDROCK: (".bedrock", "BedrockProvider", "Bedrock"),
+    ProviderType.OPENAI_COMPATIBLE: (
+        ".openai_compatible",
+        "OpenAICompatibleProvider",
+        "OpenAI-compatible",
+    ),
+}
+
+
+def _import_provider_class(module_name: str, class_name: str) -> type:
+    """Import a provider module on demand and return its provider class."""
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def __getattr__(name: str):
+    """Resolve provider classes (e.g. BedrockProvider) on first access."""
+    for module_name, class_name, _label in _PROVIDER_CLASSES.values():
+        if name == class_name:
+            return _import_provider_class(module_name, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def create_provider(config: ModelConfig) -> BaseProvider:
     """
@@ -45,18 +68,16 @@ def create_provider(config: ModelConfig) -> BaseProvider:
     """
     logger.debug(f"Creating provider for {config.name} (type: {config.provider})")
 
-    if config.provider == ProviderType.BEDROCK:
-        provider = BedrockProvider(config)
-        logger.info(f"Created Bedrock provider: {config.name}")
-        return provider
-
-    elif config.provider == ProviderType.OPENAI_COMPATIBLE:
-        provider = OpenAICompatibleProvider(config)
-        logger.info(f"Created OpenAI-compatible provider: {config.name}")
-        return provider
-
-    else:
+    entry = _PROVIDER_CLASSES.get(config.provider)
+    if entry is None:
         raise ValueError(
             f"Unknown provider type: {config.provider}. "
             f"Supported types: {', '.join([t.value for t in ProviderType])}"
         )
+
+    module_name, class_name, label = entry
+    provider_class = _import_provider_class(module_name, class_name)
+
+    provider = provider_class(config)
+    logger.info(f"Created {label} provider: {config.name}")
+    return provider
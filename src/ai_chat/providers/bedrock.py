@@ -4,7 +4,6 @@ import base64
 import logging
 from typing import AsyncIterator, Optional
 
-import boto3
 from botocore.exceptions import (
     BotoCoreError,
     ClientError,
@@ -49,6 +48,10 @@ class BedrockProvider(BaseProvider):
         self.model_id = config.model_id
         self.region = config.region or "us-east-1"
 
+        # boto3 is imported here rather than at module level because loading
+        # it is slow and only needed once a Bedrock model is actually used
+        import boto3
+
         # Initialize boto3 client
         try:
             self.client = boto3.client(
@@ -110,7 +113,7 @@ class BedrockProvider(BaseProvider):
             f"Starting Bedrock stream: model={self.model_id}, "
             f"messages={len(messages)}, max_tokens={max_tokens}"
         )
-        logger.debug(f"Bedrock request: {request}")
+        logger.debug("Bedrock request: %s", request)
 
         try:
             # Call converse_stream API
@@ -297,7 +300,7 @@ class BedrockProvider(BaseProvider):
                     # Bedrock uses "thinkingContent" or similar for reasoning
                     if "thinkingContent" in start_data or "reasoning" in str(start_data).lower():
                         content_block_types[content_block_index] = "reasoning"
-                        logger.debug(f"Detected reasoning block at index {content_block_index}")
+                        logger.debug("Detected reasoning block at index %s", content_block_index)
                     else:
                         content_block_types[content_block_index] = "text"
 
@@ -312,7 +315,7 @@ class BedrockProvider(BaseProvider):
                 if "text" in delta:
                     text = delta["text"]
                     if is_reasoning:
-                        logger.debug(f"Reasoning chunk: {text[:50]}...")
+                        logger.debug("Reasoning chunk: %.50s...", text)
                         yield StreamChunk(reasoning=text, is_reasoning=True)
                     else:
                         yield StreamChunk(content=text)
@@ -320,7 +323,7 @@ class BedrockProvider(BaseProvider):
             # Metadata - could contain stop reason
             elif "metadata" in event:
                 metadata = event["metadata"]
-                logger.debug(f"Bedrock metadata: {metadata}")
+                logger.debug("Bedrock metadata: %s", metadata)
 
                 # Check for stop reason
                 if "stopReason" in metadata:
@@ -341,7 +344,7 @@ class BedrockProvider(BaseProvider):
 
             else:
                 # Log unknown events for debugging
-                logger.debug(f"Unknown Bedrock event: {list(event.keys())}")
+                logger.debug("Unknown Bedrock event: %s", list(event))
 
     def supports_feature(self, feature: str) -> bool:
         """
@@ -3,7 +3,7 @@
 import base64
 import json
 import logging
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
 import httpx
 
@@ -17,7 +17,7 @@ from ai_chat.providers.base import (
     RateLimitError,
     StreamChunk,
 )
-from ai_chat.utils.reasoning import extract_reasoning_tags, has_reasoning_tags
+from ai_chat.utils.reasoning import extract_reasoning_tags
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +25,17 @@ logger = logging.getLogger(__name__)
 class OpenAICompatibleProvider(BaseProvider):
     """Provider for OpenAI-compatible API endpoints."""
 
-    def __init__(self, config: ModelConfig):
+    def __init__(
+        self,
+        config: ModelConfig,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Initialize provider with model configuration.
 
         Args:
             config: ModelConfig with provider=openai_compatible
+            transport: Optional httpx transport (defaults to the network)
         """
         if not config.base_url:
             raise ValueError("OpenAI-compatible provider requires base_url")
@@ -41,6 +46,7 @@ class OpenAICompatibleProvider(BaseProvider):
         self.base_url = config.base_url.rstrip("/")
         self.model = config.model
         self.api_key = config.api_key or "not-needed"
+        self.transport = transport
 
         logger.info(
             f"Initialized OpenAI-compatible provider: {config.name} "
@@ -84,10 +90,12 @@ class OpenAICompatibleProvider(BaseProvider):
             f"Starting chat stream: model={self.model}, "
             f"messages={len(messages)}, max_tokens={max_tokens}"
         )
-        logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Payload may carry base64 images; only serialize it when shown
+            logger.debug("Request payload: %s", json.dumps(payload, indent=2))
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, transport=self.transport) as client:
                 async with client.stream(
                     "POST",
                     endpoint,
@@ -172,7 +180,7 @@ class OpenAICompatibleProvider(BaseProvider):
 
                 try:
                     chunk_data = json.loads(data)
-                    logger.debug(f"Received chunk: {chunk_data}")
+                    logger.debug("Received chunk: %s", chunk_data)
 
                     # Extract content from choices
                     choices = chunk_data.get("choices", [])
@@ -1,6 +1,7 @@
 """Attachment handling for images and documents."""
 
 import base64
+import functools
 import logging
 import mimetypes
 from dataclasses import dataclass
@@ -16,7 +17,7 @@ MAX_FILE_SIZE_MB = 10
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 
 
-@dataclass
+@dataclass(frozen=True)
 class Attachment:
     """Represents a file attachment (image or document)."""
 
@@ -35,14 +36,23 @@ class Attachment:
         """Get size in megabytes."""
         return self.size_bytes / (1024 * 1024)
 
-    def to_base64(self) -> str:
-        """Convert data to base64 string."""
+    # Encodings are computed on first use and kept in the instance __dict__,
+    # outside the dataclass fields; frozen=True keeps them from going stale
+    @functools.cached_property
+    def _base64(self) -> str:
         return base64.b64encode(self.data).decode("utf-8")
 
+    @functools.cached_property
+    def _data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self._base64}"
+
+    def to_base64(self) -> str:
+        """Convert data to base64 string (cached after the first call)."""
+        return self._base64
+
     def to_data_url(self) -> str:
-        """Convert to data URL for embedding."""
-        b64_data = self.to_base64()
-        return f"data:{self.mime_type};base64,{b64_data}"
+        """Convert to data URL for embedding (cached after the first call)."""
+        return self._data_url
 
 
 class AttachmentError(Exception):
@@ -1,7 +1,7 @@
 """Chat service for managing conversations and routing to providers."""
 
 import logging
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Optional
 
 from ai_chat.config.models import AgentConfig, Config, ModelConfig
 from ai_chat.providers import BaseProvider, Message, StreamChunk, create_provider
@@ -19,6 +19,7 @@ class ChatService:
         config: Config,
         storage: Optional[StorageService] = None,
         knowledge_service: Optional[KnowledgeService] = None,
+        provider_factory: Optional[Callable[[ModelConfig], BaseProvider]] = None,
     ):
         """
         Initialize chat service with configuration.
@@ -27,10 +28,12 @@ class ChatService:
             config: Application configuration
             storage: Optional storage service for persistence
             knowledge_service: Optional knowledge service for agent knowledge
+            provider_factory: Optional provider factory (defaults to create_provider)
         """
         self.config = config
         self.storage = storage
         self.knowledge_service = knowledge_service or KnowledgeService()
+        self.provider_factory = provider_factory or create_provider
         self.messages: list[Message] = []
         self.current_model_key: str = config.app.default_model
         self.current_agent_key: str = config.app.default_agent
@@ -330,7 +333,7 @@ class ChatService:
         Raises:
             ValueError: If provider type not supported
         """
-        return create_provider(model_config)
+        return self.provider_factory(model_config)
 
     async def stream_response(
         self,
@@ -383,9 +386,9 @@ class ChatService:
             f"(conversation length: {len(self.messages)})"
         )
 
-        # Stream response
-        assistant_message = ""
-        assistant_reasoning = ""
+        # Collect streamed parts and join once at the end
+        content_parts: list[str] = []
+        reasoning_parts: list[str] = []
         try:
             async for chunk in provider.stream_chat(
                 messages_to_send,
@@ -394,13 +397,15 @@ class ChatService:
             ):
                 # Accumulate assistant message and reasoning
                 if chunk.content:
-                    assistant_message += chunk.content
+                    content_parts.append(chunk.content)
                 if chunk.reasoning:
-                    assistant_reasoning += chunk.reasoning
+                    reasoning_parts.append(chunk.reasoning)
 
                 yield chunk
 
             # Add complete assistant message to history (with reasoning for persistence)
+            assistant_message = "".join(content_parts)
+            assistant_reasoning = "".join(reasoning_parts)
             if assistant_message:
                 self.add_message(
                     "assistant",
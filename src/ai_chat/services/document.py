@@ -5,10 +5,25 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
+# HTML comment marker: <!-- DOCUMENT: filename.md -->
+_COMMENT_MARKER_RE = re.compile(r"<!--\s*DOCUMENT:\s*([^\s]+)\s*-->", re.IGNORECASE)
+
+# Fenced code block with download marker: ```markdown download
+_FENCE_MARKER_RE = re.compile(
+    r"```(?:markdown|md)\s+download\s*\n(.*?)```", re.DOTALL | re.IGNORECASE
+)
+
+# First level-1 or level-2 heading
+_TITLE_HEADING_RE = re.compile(r"^#{1,2}\s+(.+)$", re.MULTILINE)
+
+# Filename cleanup: drop special characters, then collapse spaces/underscores
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\s-]")
+_FILENAME_SEPARATOR_RE = re.compile(r"[\s_]+")
+
 
 @dataclass
 class GeneratedDocument:
@@ -55,9 +70,7 @@ def detect_document_marker(text: str) -> Optional[tuple[str, str]]:
         Tuple of (filename, content) if found, None otherwise
     """
     # Pattern 1: HTML comment marker
-    # <!-- DOCUMENT: filename.md -->
-    comment_pattern = r"<!--\s*DOCUMENT:\s*([^\s]+)\s*-->"
-    comment_match = re.search(comment_pattern, text, re.IGNORECASE)
+    comment_match = _COMMENT_MARKER_RE.search(text)
 
     if comment_match:
         filename = comment_match.group(1).strip()
@@ -65,20 +78,18 @@ def detect_document_marker(text: str) -> Optional[tuple[str, str]]:
         content_start = comment_match.end()
         content = text[content_start:].strip()
 
-        logger.debug(f"Detected document marker: {filename}")
+        logger.debug("Detected document marker: %s", filename)
         return (filename, content)
 
     # Pattern 2: Fenced code block with download marker
-    # ```markdown download
-    fence_pattern = r"```(?:markdown|md)\s+download\s*\n(.*?)```"
-    fence_match = re.search(fence_pattern, text, re.DOTALL | re.IGNORECASE)
+    fence_match = _FENCE_MARKER_RE.search(text)
 
     if fence_match:
         content = fence_match.group(1).strip()
         # Try to extract filename from first heading
         filename = generate_filename_from_content(content)
 
-        logger.debug(f"Detected fenced download block: {filename}")
+        logger.debug("Detected fenced download block: %s", filename)
         return (filename, content)
 
     return None
@@ -134,8 +145,8 @@ def generate_filename_from_content(content: str) -> str:
     if title:
         # Convert title to filename
         # Remove special characters, replace spaces with dashes
-        filename = re.sub(r'[^\w\s-]', '', title)
-        filename = re.sub(r'[\s_]+', '-', filename)
+        filename = _FILENAME_UNSAFE_RE.sub("", title)
+        filename = _FILENAME_SEPARATOR_RE.sub("-", filename)
         filename = filename.lower().strip('-')
         # Limit length
         filename = filename[:50]
@@ -157,12 +168,11 @@ def extract_title_from_content(content: str) -> Optional[str]:
         Title if found, None otherwise
     """
     # Look for first heading (# or ##)
-    heading_pattern = r"^#{1,2}\s+(.+)$"
-    match = re.search(heading_pattern, content, re.MULTILINE)
+    match = _TITLE_HEADING_RE.search(content)
 
     if match:
         title = match.group(1).strip()
-        logger.debug(f"Extracted title: {title}")
+        logger.debug("Extracted title: %s", title)
         return title
 
     return None
@@ -202,24 +212,34 @@ def add_metadata_frontmatter(
     return document
 
 
-def save_document(document: GeneratedDocument, output_path: Path) -> None:
+def save_document(
+    document: GeneratedDocument,
+    output_path: Path,
+    *,
+    writer: Optional[Callable[[Path, str], None]] = None,
+) -> None:
     """
     Save document to file.
 
     Args:
         document: Document to save
         output_path: Path to save to
+        writer: Optional callable taking (path, content) used instead of
+            creating parent directories and writing to disk
 
     Raises:
         IOError: If save fails
     """
     try:
-        # Create parent directories if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Write content with metadata
         content = document.content_with_metadata
-        output_path.write_text(content, encoding="utf-8")
+
+        if writer is None:
+            # Create parent directories if needed
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(content, encoding="utf-8")
+        else:
+            writer(output_path, content)
 
         logger.info(f"Saved document to {output_path} ({len(content)} chars)")
 
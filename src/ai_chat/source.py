@@ -23,22 +23,27 @@ logger = logging.getLogger(__name__)
 class AIChatSource:
     """AI Chat source plugin for capturing AI responses."""
 
+    # Fixed identity; plain class attributes satisfy the Source protocol's
+    # read-only properties without a per-access call
+    source_id = "ai_chat"
+    display_name = "AI Chat"
+
+    # Capability flags; the property hands out copies so callers can't alter them
+    _CAPABILITIES = {
+        "supports_selection": True,
+        "supports_full_capture": True,
+        "supports_streaming": False,
+        "supports_attachments": False,
+    }
+
+    __slots__ = ("_widget", "_context")
+
     def __init__(self):
         """Initialize AI Chat source."""
         self._widget: Optional[ChatWidget] = None
         self._context: Optional[SourceContext] = None
         logger.info("AIChatSource initialized")
 
-    @property
-    def source_id(self) -> str:
-        """Source identifier."""
-        return "ai_chat"
-
-    @property
-    def display_name(self) -> str:
-        """Display name."""
-        return "AI Chat"
-
     @property
     def icon(self) -> Optional[str]:
         """Icon path."""
@@ -51,12 +56,7 @@ class AIChatSource:
     @property
     def capabilities(self) -> dict:
         """Source capabilities."""
-        return {
-            "supports_selection": True,
-            "supports_full_capture": True,
-            "supports_streaming": False,
-            "supports_attachments": False,
-        }
+        return dict(self._CAPABILITIES)
 
     def create_widget(self, context: SourceContext) -> QWidget:
         """
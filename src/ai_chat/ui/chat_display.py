@@ -148,7 +148,7 @@ class ChatDisplay(QWidget):
             reasoning: Reasoning chunk to append
         """
         self._current_reasoning += reasoning
-        logger.debug(f"Appended reasoning chunk: {reasoning[:50]}...")
+        logger.debug("Appended reasoning chunk: %.50s...", reasoning)
         self._render_and_update_current_message()
 
     def _render_and_update_current_message(self) -> None:
@@ -1,11 +1,36 @@
 """Clipboard operations for copying text."""
 
 import logging
+from typing import Optional
 
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QClipboard, QGuiApplication
 
 logger = logging.getLogger(__name__)
 
+# Application clipboard, fetched on first use
+_clipboard: Optional[QClipboard] = None
+
+
+def _get_clipboard() -> QClipboard:
+    """
+    Get the application clipboard, caching it after the first lookup.
+
+    Returns:
+        QClipboard instance
+    """
+    global _clipboard
+    if _clipboard is None:
+        _clipboard = QGuiApplication.clipboard()
+        # Forget the cached clipboard if the application tears it down
+        _clipboard.destroyed.connect(_clear_clipboard_cache)
+    return _clipboard
+
+
+def _clear_clipboard_cache() -> None:
+    """Drop the cached clipboard reference."""
+    global _clipboard
+    _clipboard = None
+
 
 def copy_to_clipboard(text: str) -> bool:
     """
@@ -18,9 +43,8 @@ def copy_to_clipboard(text: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
-        logger.debug(f"Copied {len(text)} characters to clipboard")
+        _get_clipboard().setText(text)
+        logger.debug("Copied %d characters to clipboard", len(text))
         return True
     except Exception as e:
         logger.error(f"Failed to copy to clipboard: {e}")
@@ -35,9 +59,8 @@ def get_clipboard_text() -> str:
         Clipboard text, or empty string if none
     """
     try:
-        clipboard = QApplication.clipboard()
-        text = clipboard.text()
-        logger.debug(f"Retrieved {len(text)} characters from clipboard")
+        text = _get_clipboard().text()
+        logger.debug("Retrieved %d characters from clipboard", len(text))
         return text
     except Exception as e:
         logger.error(f"Failed to get clipboard text: {e}")
@@ -1,12 +1,18 @@
 """Logging configuration and setup utilities."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
 from ai_chat.config.models import LoggingConfig
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(
     config: Optional[LoggingConfig] = None, log_level_override: Optional[str] = None
@@ -18,6 +24,8 @@ def setup_logging(
         config: LoggingConfig object (uses defaults if None)
         log_level_override: Optional log level from CLI (takes precedence)
     """
+    global _queue_listener
+
     if config is None:
         config = LoggingConfig()
 
@@ -38,15 +46,17 @@ def setup_logging(
     root_logger.setLevel(numeric_level)
 
     # Remove existing handlers
+    _stop_queue_listener()
     root_logger.handlers.clear()
 
     # Console handler (always present)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # File handler (optional)
+    file_path = None
     if config.file and config.file.strip():
         file_path = Path(config.file).expanduser().resolve()
 
@@ -54,10 +64,27 @@ def setup_logging(
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = logging.FileHandler(file_path)
-        file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
 
+        # Batch routine records into fewer file writes. Warnings and above
+        # flush straight away and the batch is small, so a crash loses at
+        # most a few INFO/DEBUG lines
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=32, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_handler.setLevel(numeric_level)
+        handlers.append(buffered_handler)
+
+    # Log calls only enqueue records; a background thread does the I/O so
+    # the UI event loop never blocks on console or file writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    if file_path is not None:
         root_logger.info(f"Logging to file: {file_path}")
 
     # Set levels for noisy third-party libraries
@@ -70,6 +97,21 @@ def setup_logging(
     root_logger.info(f"Logging configured at level: {level}")
 
 
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued and buffered records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            # Closing a MemoryHandler flushes it but leaves its target open
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger for the specified module.
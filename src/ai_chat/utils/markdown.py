@@ -1,18 +1,63 @@
 """Markdown rendering utilities with syntax highlighting."""
 
+import functools
+import html as _html
 import logging
 import re
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Optional
 
 import markdown
-from markdown.extensions import fenced_code, tables, nl2br
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import get_lexer_by_name, guess_lexer
-from pygments.util import ClassNotFound
+
+# Pygments is imported on first use to keep it off the startup path
+if TYPE_CHECKING:
+    from pygments.formatters import HtmlFormatter
 
 logger = logging.getLogger(__name__)
 
+# Anything that might make a message more than a single plain paragraph:
+# line breaks, tabs, markdown/HTML syntax characters, Markdown's internal
+# placeholder characters, and list or rule markers at the start
+_MARKDOWN_SYNTAX_RE = re.compile(
+    r"[\n\r\t\v\f\x02\x03\\`*_\[\]<>&#~|]|^(?:\s|[-+]\s|- *- *-|\d+[.)]\s)"
+)
+
+# Guards the shared Markdown instance, which holds per-document state
+_markdown_lock = threading.Lock()
+
+# Inline markup removed by strip_markdown. Alternatives without a named group
+# are dropped entirely; the others keep their group. Longer delimiters come
+# first so "***x***" isn't read as "*" + "**x**".
+_INLINE_MARKDOWN_PATTERN = (
+    r"```(?:\w*\n)?"
+    r"|\*\*\*(?P<bold_italic>.+?)\*\*\*"
+    r"|\*\*(?P<bold>.+?)\*\*"
+    r"|\*(?P<italic>.+?)\*"
+    r"|___(?P<u_bold_italic>.+?)___"
+    r"|__(?P<u_bold>.+?)__"
+    r"|_(?P<u_italic>.+?)_"
+    r"|`(?P<code>.+?)`"
+    r"|!\[.*?\]\(.+?\)"
+    r"|\[(?P<link>.+?)\]\(.+?\)"
+)
+
+# All markup removed by strip_markdown, matched in a single scan. Header
+# markers only count at real line starts, so this is for the top level only.
+_STRIP_MARKDOWN_RE = re.compile(r"^#+\s+|" + _INLINE_MARKDOWN_PATTERN, re.MULTILINE)
+
+# Rescans emphasis and link content, where a "#" is just text
+_STRIP_INLINE_MARKDOWN_RE = re.compile(_INLINE_MARKDOWN_PATTERN)
+
+# Characters that can start any construct in _STRIP_INLINE_MARKDOWN_RE
+_INLINE_MARKUP_CHAR_RE = re.compile(r"[`*_!\[]")
+
+# Fenced code blocks in rendered HTML: <code class="language-LANG">...</code>
+_CODE_BLOCK_RE = re.compile(r'<code class="language-(\w+)">(.*?)</code>', re.DOTALL)
+
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}
+)
+
 
 class CodeBlockProcessor:
     """Process code blocks with syntax highlighting."""
@@ -25,12 +70,8 @@ class CodeBlockProcessor:
             theme: Pygments theme name
         """
         self.theme = theme
-        self.formatter = HtmlFormatter(
-            style=theme,
-            noclasses=False,
-            cssclass="highlight",
-        )
-        logger.debug(f"CodeBlockProcessor initialized with theme: {theme}")
+        self.formatter = _get_formatter(theme)
+        logger.debug("CodeBlockProcessor initialized with theme: %s", theme)
 
     def highlight_code(self, code: str, language: Optional[str] = None) -> str:
         """
@@ -43,29 +84,79 @@ class CodeBlockProcessor:
         Returns:
             HTML string with syntax highlighting
         """
+        from pygments import highlight
+        from pygments.lexers import guess_lexer
+        from pygments.util import ClassNotFound
+
         try:
             if language:
-                lexer = get_lexer_by_name(language, stripall=True)
+                lexer = _get_lexer(language)
             else:
                 # Try to guess language
                 lexer = guess_lexer(code)
 
             highlighted = highlight(code, lexer, self.formatter)
-            logger.debug(f"Highlighted code block (language: {language or 'auto'})")
+            logger.debug("Highlighted code block (language: %s)", language or "auto")
             return highlighted
 
         except ClassNotFound:
-            logger.debug(f"No lexer found for language: {language}, using plain text")
+            logger.debug("No lexer found for language: %s, using plain text", language)
             # Fallback to plain text
-            from pygments.lexers import TextLexer
-            lexer = TextLexer()
-            return highlight(code, lexer, self.formatter)
+            return highlight(code, _get_text_lexer(), self.formatter)
         except Exception as e:
             logger.warning(f"Error highlighting code: {e}")
             # Fallback to escaped HTML
             return f'<pre><code>{_escape_html(code)}</code></pre>'
 
 
+@functools.lru_cache(maxsize=8)
+def _get_formatter(theme: str) -> "HtmlFormatter":
+    """
+    Get a shared HTML formatter for a Pygments theme.
+
+    Args:
+        theme: Pygments theme name
+
+    Returns:
+        HtmlFormatter instance for the theme
+    """
+    from pygments.formatters import HtmlFormatter
+
+    return HtmlFormatter(style=theme, noclasses=False, cssclass="highlight")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_lexer(language: str):
+    """
+    Get a shared lexer for a language name.
+
+    Args:
+        language: Programming language (e.g., 'python', 'javascript')
+
+    Returns:
+        Pygments lexer instance
+
+    Raises:
+        ClassNotFound: If no lexer exists for the language
+    """
+    from pygments.lexers import get_lexer_by_name
+
+    return get_lexer_by_name(language, stripall=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_text_lexer():
+    """
+    Get the shared plain-text lexer used when no language lexer is found.
+
+    Returns:
+        Pygments TextLexer instance
+    """
+    from pygments.lexers import TextLexer
+
+    return TextLexer()
+
+
 def _escape_html(text: str) -> str:
     """
     Escape HTML special characters.
@@ -76,13 +167,7 @@ def _escape_html(text: str) -> str:
     Returns:
         Escaped text safe for HTML
     """
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    return text.translate(_HTML_ESCAPE_TABLE)
 
 
 def render_markdown(text: str, theme: str = "monokai") -> str:
@@ -107,10 +192,41 @@ def render_markdown(text: str, theme: str = "monokai") -> str:
     Returns:
         Rendered HTML string
     """
-    logger.debug(f"Rendering markdown ({len(text)} chars)")
+    logger.debug("Rendering markdown (%d chars)", len(text))
 
-    # Create markdown instance with extensions
-    md = markdown.Markdown(
+    # Fast path: a single line with no markdown syntax renders as one
+    # paragraph, so skip the Markdown pipeline and highlighting entirely.
+    # Four or more leading spaces would make it an indented code block.
+    # The syntax check already rules out "&", "<" and ">", so the body is
+    # used as is, exactly as Markdown would emit it (quotes stay bare).
+    body = text.lstrip(" ")
+    if len(text) - len(body) < 4 and _MARKDOWN_SYNTAX_RE.search(body) is None:
+        return f"<p>{body}</p>" if body else ""
+
+    # Convert markdown to HTML with the shared, reset instance
+    with _markdown_lock:
+        html = _get_markdown().reset().convert(text)
+
+    # Post-process: apply syntax highlighting to code blocks
+    processor = CodeBlockProcessor(theme=theme)
+    html = _apply_syntax_highlighting(html, processor)
+
+    logger.debug("Rendered HTML (%d chars)", len(html))
+    return html
+
+
+@functools.lru_cache(maxsize=1)
+def _get_markdown() -> markdown.Markdown:
+    """
+    Get the shared Markdown converter, creating it on first use.
+
+    Extension setup dominates the cost of short renders, so one instance
+    is reused and reset between documents.
+
+    Returns:
+        Markdown instance with the app's extensions
+    """
+    return markdown.Markdown(
         extensions=[
             "fenced_code",
             "tables",
@@ -124,16 +240,6 @@ def render_markdown(text: str, theme: str = "monokai") -> str:
         },
     )
 
-    # Convert markdown to HTML
-    html = md.convert(text)
-
-    # Post-process: apply syntax highlighting to code blocks
-    processor = CodeBlockProcessor(theme=theme)
-    html = _apply_syntax_highlighting(html, processor)
-
-    logger.debug(f"Rendered HTML ({len(html)} chars)")
-    return html
-
 
 def _apply_syntax_highlighting(html: str, processor: CodeBlockProcessor) -> str:
     """
@@ -146,35 +252,39 @@ def _apply_syntax_highlighting(html: str, processor: CodeBlockProcessor) -> str:
     Returns:
         HTML with highlighted code blocks
     """
-    # Pattern to match: <code class="language-LANG">...</code>
-    pattern = r'<code class="language-(\w+)">(.*?)</code>'
-
-    def replace_code_block(match):
-        language = match.group(1)
-        code = match.group(2)
-        # Unescape HTML entities
-        code = code.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
-        return processor.highlight_code(code, language)
+    if '<code class="language-' not in html:
+        return html
 
-    html = re.sub(pattern, replace_code_block, html, flags=re.DOTALL)
+    parts = []
+    last_end = 0
+    for match in _CODE_BLOCK_RE.finditer(html):
+        language, code = match.groups()
+        # Unescape HTML entities (Pygments re-escapes when highlighting)
+        code = _html.unescape(code)
+        parts.append(html[last_end:match.start()])
+        parts.append(processor.highlight_code(code, language))
+        last_end = match.end()
+    parts.append(html[last_end:])
 
-    # Also handle plain <code> blocks (inline code - no highlighting needed)
-    return html
+    # Plain <code> blocks (inline code) are left as-is
+    return "".join(parts)
 
 
+@functools.lru_cache(maxsize=8)
 def get_pygments_css(theme: str = "monokai") -> str:
     """
     Get CSS for Pygments syntax highlighting.
 
+    The result is cached per theme.
+
     Args:
         theme: Pygments theme name
 
     Returns:
         CSS string
     """
-    formatter = HtmlFormatter(style=theme, noclasses=False, cssclass="highlight")
-    css = formatter.get_style_defs()
-    logger.debug(f"Generated Pygments CSS for theme: {theme}")
+    css = _get_formatter(theme).get_style_defs()
+    logger.debug("Generated Pygments CSS for theme: %s", theme)
     return css
 
 
@@ -188,28 +298,38 @@ def strip_markdown(text: str) -> str:
     Returns:
         Plain text without markdown formatting
     """
-    # Remove headers
-    text = re.sub(r"^#+\s+", "", text, flags=re.MULTILINE)
+    return _strip_markdown_impl(text).strip()
 
-    # Remove bold/italic
-    text = re.sub(r"\*\*\*(.+?)\*\*\*", r"\1", text)
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"___(.+?)___", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
-    text = re.sub(r"_(.+?)_", r"\1", text)
 
-    # Remove inline code
-    text = re.sub(r"`(.+?)`", r"\1", text)
-
-    # Remove links but keep text
-    text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
-
-    # Remove images
-    text = re.sub(r"!\[.*?\]\(.+?\)", "", text)
+def _strip_markdown_impl(text: str, pattern: re.Pattern = _STRIP_MARKDOWN_RE) -> str:
+    """
+    Strip markdown in one pass over the text, tokenizing with finditer.
 
-    # Remove code fences
-    text = re.sub(r"```[\w]*\n", "", text)
-    text = re.sub(r"```", "", text)
+    Args:
+        text: Markdown text
+        pattern: Markup to remove; nested content uses the inline-only pattern
 
-    return text.strip()
+    Returns:
+        Text without markdown formatting (not stripped of whitespace)
+    """
+    parts = []
+    last_end = 0
+    for match in pattern.finditer(text):
+        parts.append(text[last_end:match.start()])
+        last_end = match.end()
+
+        # Headers, code fences and images have no group and keep no text
+        kind = match.lastgroup
+        if kind is None:
+            continue
+        content = match.group(kind)
+        # Emphasis and link text may nest further markup; inline code is
+        # literal. Only rescan content that has a markup character.
+        if kind != "code" and _INLINE_MARKUP_CHAR_RE.search(content):
+            content = _strip_markdown_impl(content, _STRIP_INLINE_MARKDOWN_RE)
+        parts.append(content)
+
+    if not parts:
+        return text
+    parts.append(text[last_end:])
+    return "".join(parts)
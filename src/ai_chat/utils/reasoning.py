@@ -6,11 +6,29 @@ from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Opening tag of any supported reasoning format
+_REASONING_OPEN_TAG_RE = re.compile(r"<(?:think|reasoning|thought)>", re.IGNORECASE)
+
+# Complete reasoning block; the closing tag must match the opening one.
+# Content can't run past another opening or closing tag of the same kind,
+# so each attempt stops at the next such tag. A lazy .*? would rescan to
+# the end of the text for every unclosed tag (quadratic on inputs like
+# "<think>" * n).
+_REASONING_BLOCK_RE = re.compile(
+    r"<(?P<tag>think|reasoning|thought)>"
+    r"(?P<content>[^<]*(?:<(?!/?(?P=tag)>)[^<]*)*)"
+    r"</(?P=tag)>",
+    re.DOTALL | re.IGNORECASE,
+)
+
 
 def extract_reasoning_tags(text: str) -> Tuple[Optional[str], str]:
     """
     Extract reasoning content from text with <think> or <reasoning> tags.
 
+    This is the single entry point for reasoning extraction; it is safe to
+    call on text without tags.
+
     Supports various tag formats:
     - <think>...</think>
     - <reasoning>...</reasoning>
@@ -24,24 +42,33 @@ def extract_reasoning_tags(text: str) -> Tuple[Optional[str], str]:
         - reasoning_content: Extracted reasoning or None
         - cleaned_text: Text with reasoning tags removed
     """
+    if not text:
+        return None, text
+
+    # Most responses have no markup at all; skip the regex for those
+    if "<" not in text:
+        return None, text.strip()
+
+    first_match = []
+
+    def _remove_block(match: re.Match) -> str:
+        if not first_match:
+            first_match.append(match)
+        return ""
+
+    # One pass finds the first block of any supported tag and removes
+    # every block from the text
+    cleaned_text = _REASONING_BLOCK_RE.sub(_remove_block, text)
+
     reasoning_content = None
-    cleaned_text = text
-
-    # Patterns for different reasoning tag formats
-    patterns = [
-        (r"<think>(.*?)</think>", "think"),
-        (r"<reasoning>(.*?)</reasoning>", "reasoning"),
-        (r"<thought>(.*?)</thought>", "thought"),
-    ]
-
-    for pattern, tag_name in patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-        if match:
-            reasoning_content = match.group(1).strip()
-            # Remove the tags from the text
-            cleaned_text = re.sub(pattern, "", text, flags=re.DOTALL | re.IGNORECASE)
-            logger.debug(f"Extracted {len(reasoning_content)} chars from <{tag_name}> tags")
-            break
+    if first_match:
+        match = first_match[0]
+        reasoning_content = match.group("content").strip()
+        logger.debug(
+            "Extracted %d chars from <%s> tags",
+            len(reasoning_content),
+            match.group("tag"),
+        )
 
     # Clean up any extra whitespace
     cleaned_text = cleaned_text.strip()
@@ -53,23 +80,22 @@ def has_reasoning_tags(text: str) -> bool:
     """
     Check if text contains reasoning tags.
 
+    Only use this when a yes/no answer is all that's needed. To get the
+    reasoning itself, call extract_reasoning_tags directly (it returns None
+    when there are no tags) rather than checking here first, which would
+    scan the text twice.
+
     Args:
         text: Text to check
 
     Returns:
         True if reasoning tags found
     """
-    patterns = [
-        r"<think>",
-        r"<reasoning>",
-        r"<thought>",
-    ]
-
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+    # Most responses have no markup at all; skip the regex for those
+    if not text or "<" not in text:
+        return False
 
-    return False
+    return _REASONING_OPEN_TAG_RE.search(text) is not None
 
 
 def count_tokens_approximate(text: str) -> int:
@@ -87,9 +113,22 @@ def count_tokens_approximate(text: str) -> int:
     if not text:
         return 0
 
+    return _tokens_for_length(len(text))
+
+
+def _tokens_for_length(length: int) -> int:
+    """
+    Approximate token count for a text of the given length.
+
+    Args:
+        length: Text length in characters
+
+    Returns:
+        Approximate token count
+    """
     # Simple approximation: average ~4 chars per token
     # This is rough but good enough for display purposes
-    return len(text) // 4
+    return length // 4
 
 
 def format_reasoning_for_display(reasoning: str, max_preview_length: int = 200) -> dict:
@@ -103,16 +142,19 @@ def format_reasoning_for_display(reasoning: str, max_preview_length: int = 200)
     Returns:
         Dict with formatted reasoning info
     """
-    token_count = count_tokens_approximate(reasoning)
+    length = len(reasoning)
+    is_truncated = length > max_preview_length
 
-    # Create preview (first N characters)
-    preview = reasoning[:max_preview_length]
-    if len(reasoning) > max_preview_length:
-        preview += "..."
+    # Create preview (first N characters); only the preview window is
+    # trimmed, never the full reasoning text
+    if is_truncated:
+        preview = reasoning[:max_preview_length].rstrip() + "..."
+    else:
+        preview = reasoning
 
     return {
         "full_text": reasoning,
         "preview": preview,
-        "token_count": token_count,
-        "is_truncated": len(reasoning) > max_preview_length,
+        "token_count": _tokens_for_length(length),
+        "is_truncated": is_truncated,
     }
@@ -0,0 +1,39 @@
+"""Benchmarks for capture payload serialization."""
+
+import pytest
+
+from ai_chat.contracts import CapturePayload, FormatHint, Provenance, SourceType
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="contracts")
+
+# ~50 KB markdown capture with 20 provenance and metadata keys, built once
+_PAYLOAD = CapturePayload(
+    content="Captured paragraph with some *markdown* text.\n" * 1100,
+    source_type=SourceType.TEXT,
+    format_hint=FormatHint.MARKDOWN,
+    provenance=Provenance(
+        source_id="bench_source",
+        source_name="Bench Source",
+        captured_at="2024-01-01T00:00:00",
+        extra={f"key_{n}": f"value {n}" for n in range(20)},
+    ),
+    metadata={f"meta_{n}": n for n in range(20)},
+)
+
+
+def test_to_markdown(benchmark):
+    """Render a large capture with frontmatter to markdown."""
+    result = benchmark(_PAYLOAD.to_markdown)
+
+    assert result.startswith("---\nsource: Bench Source\n")
+    assert "key_19: value 19" in result
+
+
+def test_to_dict(benchmark):
+    """Convert a large capture to a dictionary."""
+    result = benchmark(_PAYLOAD.to_dict)
+
+    assert result["provenance"]["key_19"] == "value 19"
+    assert len(result["metadata"]) == 20
@@ -0,0 +1,52 @@
+"""Benchmarks for markdown rendering and stripping."""
+
+import pytest
+
+from ai_chat.utils.markdown import render_markdown, strip_markdown
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="markdown")
+
+_SECTION = '''## Section {n}
+
+Some **bold** and *italic* prose with `inline code` and a
+[link](https://example.com/{n}) that wraps onto a second line.
+
+- First item
+- Second item with `code`
+- Third item
+
+| Name | Value |
+|------|-------|
+| a{n} | {n}   |
+| b{n} | {n}   |
+
+```python
+def handler_{n}(request):
+    if request.size < {n} and request.ok:
+        return {{"status": "ok", "id": {n}}}
+    return None
+```
+
+'''
+
+# Realistic ~8 KB assistant reply with headings, lists, tables and code fences
+_LARGE_MARKDOWN = "# Benchmark Document\n\n" + "".join(
+    _SECTION.format(n=n) for n in range(21)
+)
+
+
+def test_render_markdown(benchmark):
+    """Render a large mixed-content document."""
+    html = benchmark(render_markdown, _LARGE_MARKDOWN)
+
+    assert "<table>" in html
+    assert "highlight" in html
+
+
+def test_strip_markdown(benchmark):
+    """Strip markup from a large mixed-content document."""
+    plain = benchmark(strip_markdown, _LARGE_MARKDOWN)
+
+    assert "**" not in plain
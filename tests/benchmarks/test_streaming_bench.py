@@ -0,0 +1,55 @@
+"""Benchmarks for the chat streaming hot path."""
+
+import asyncio
+
+import pytest
+
+from ai_chat.providers.openai_compatible import OpenAICompatibleProvider
+from ai_chat.services import ChatService
+from tests.fixtures.openai_responses import (
+    create_sse_chunk,
+    create_sse_done_marker,
+    mock_sse_transport,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+STREAM_CHUNKS = 10_000
+
+# Canned 10k-chunk SSE response body, built once per module
+_STREAM_BODY = "".join(
+    [create_sse_chunk("token ") for _ in range(STREAM_CHUNKS)]
+    + [create_sse_chunk("", finish_reason="stop"), create_sse_done_marker()]
+).encode()
+
+
+@pytest.fixture
+def chat_service(valid_config):
+    """Create chat service whose provider talks to an in-memory transport."""
+    transport = mock_sse_transport(_STREAM_BODY)
+    return ChatService(
+        valid_config,
+        provider_factory=lambda model_config: OpenAICompatibleProvider(
+            model_config, transport=transport
+        ),
+    )
+
+
+def test_streaming_throughput(benchmark, chat_service):
+    """Stream a 10k-chunk response through ChatService and the provider."""
+
+    async def run():
+        chat_service.clear_history()
+        count = 0
+        async for chunk in chat_service.stream_response("x"):
+            if chunk.content:
+                count += 1
+        return count
+
+    count = benchmark(lambda: asyncio.run(run()))
+
+    assert count == STREAM_CHUNKS
+    if benchmark.stats:  # None under --benchmark-disable
+        benchmark.extra_info["chunks_per_second"] = STREAM_CHUNKS / benchmark.stats.stats.mean
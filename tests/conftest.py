@@ -1,18 +1,22 @@
 """Shared pytest fixtures for all tests."""
 
+import hashlib
+
 import pytest
 from pathlib import Path
 
 
-@pytest.fixture
-def tmp_config_dir(tmp_path):
-    """Create a temporary config directory."""
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    return config_dir
+@pytest.fixture(scope="session")
+def boto3_default_session():
+    """Share one boto3 session for any client created outside a mock."""
+    import boto3
+
+    boto3.setup_default_session(region_name="us-east-1")
+    yield boto3.DEFAULT_SESSION
+    boto3.DEFAULT_SESSION = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_config_toml():
     """Return content for a valid minimal configuration."""
     return """
@@ -45,7 +49,17 @@ temperature = 0.7
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def valid_config(valid_config_toml, tmp_path_factory):
+    """Load the valid minimal configuration once (shared, treat as read-only)."""
+    from ai_chat.config import load_config
+
+    config_file = tmp_path_factory.mktemp("config") / "models.toml"
+    config_file.write_text(valid_config_toml)
+    return load_config(str(config_file))
+
+
+@pytest.fixture(scope="session")
 def bedrock_config_toml():
     """Return content for a Bedrock model configuration."""
     return """
@@ -67,13 +81,21 @@ temperature = 0.7
 """
 
 
-@pytest.fixture
-def write_config_file(tmp_config_dir):
-    """Factory fixture to write config content to file."""
+@pytest.fixture(scope="session")
+def write_config_file(tmp_path_factory):
+    """Factory fixture to write config content to file.
+
+    Files are cached by content, so identical configs are written once per
+    session. Treat the returned files as read-only.
+    """
+    cache = {}
 
     def _write(content: str, filename: str = "models.toml") -> Path:
-        file_path = tmp_config_dir / filename
-        file_path.write_text(content)
-        return file_path
+        key = hashlib.sha1(content.encode()).hexdigest()
+        if (key, filename) not in cache:
+            file_path = tmp_path_factory.mktemp(f"config-{key[:8]}") / filename
+            file_path.write_text(content)
+            cache[key, filename] = file_path
+        return cache[key, filename]
 
     return _write
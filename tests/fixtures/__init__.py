@@ -4,6 +4,8 @@ from .openai_responses import (
     create_sse_chunk,
     create_sse_done_marker,
     mock_streaming_response,
+    mock_streaming_body,
+    mock_sse_transport,
     mock_single_chunk_response,
     mock_empty_response,
 )
@@ -13,12 +15,15 @@ from .bedrock_responses import (
     mock_bedrock_empty_response,
     mock_bedrock_error_response,
 )
+from .streams import drain
 
 __all__ = [
     # OpenAI fixtures
     "create_sse_chunk",
     "create_sse_done_marker",
     "mock_streaming_response",
+    "mock_streaming_body",
+    "mock_sse_transport",
     "mock_single_chunk_response",
     "mock_empty_response",
     # Bedrock fixtures
@@ -26,4 +31,6 @@ __all__ = [
     "mock_bedrock_single_chunk",
     "mock_bedrock_empty_response",
     "mock_bedrock_error_response",
+    # Stream helpers
+    "drain",
 ]
@@ -1,73 +1,100 @@
 """Mock Bedrock API responses for testing."""
 
-
-def mock_bedrock_stream_response() -> dict:
-    """
-    Create a mock Bedrock converse_stream response.
-
-    Returns:
-        Mock response dict with stream generator
-    """
-
-    def stream_generator():
-        """Generate Bedrock stream events."""
-        # Content block start
-        yield {
-            "contentBlockStart": {
-                "start": {"text": ""},
-                "contentBlockIndex": 0,
-            }
+# Stream events are shared, read-only module constants; each mock response
+# hands out the tuple itself, which can be iterated any number of times.
+
+_BEDROCK_STREAM_EVENTS = (
+    # Content block start
+    {
+        "contentBlockStart": {
+            "start": {"text": ""},
+            "contentBlockIndex": 0,
         }
-
-        # Content deltas (the actual response text)
-        yield {
-            "contentBlockDelta": {
-                "delta": {"text": "Hello"},
-                "contentBlockIndex": 0,
-            }
+    },
+    # Content deltas (the actual response text)
+    {
+        "contentBlockDelta": {
+            "delta": {"text": "Hello"},
+            "contentBlockIndex": 0,
         }
-
-        yield {
-            "contentBlockDelta": {
-                "delta": {"text": " from"},
-                "contentBlockIndex": 0,
-            }
+    },
+    {
+        "contentBlockDelta": {
+            "delta": {"text": " from"},
+            "contentBlockIndex": 0,
         }
-
-        yield {
-            "contentBlockDelta": {
-                "delta": {"text": " Bedrock!"},
-                "contentBlockIndex": 0,
-            }
+    },
+    {
+        "contentBlockDelta": {
+            "delta": {"text": " Bedrock!"},
+            "contentBlockIndex": 0,
         }
-
-        # Content block stop
-        yield {
-            "contentBlockStop": {
-                "contentBlockIndex": 0,
-            }
+    },
+    # Content block stop
+    {
+        "contentBlockStop": {
+            "contentBlockIndex": 0,
         }
-
-        # Metadata with stop reason
-        yield {
-            "metadata": {
-                "usage": {
-                    "inputTokens": 10,
-                    "outputTokens": 5,
-                    "totalTokens": 15,
-                },
-                "stopReason": "end_turn",
-            }
+    },
+    # Metadata with stop reason
+    {
+        "metadata": {
+            "usage": {
+                "inputTokens": 10,
+                "outputTokens": 5,
+                "totalTokens": 15,
+            },
+            "stopReason": "end_turn",
         }
+    },
+    # Message stop
+    {
+        "messageStop": {
+            "stopReason": "end_turn",
+        }
+    },
+)
+
+_BEDROCK_SINGLE_CHUNK_EVENTS = (
+    {
+        "contentBlockDelta": {
+            "delta": {"text": "Complete response"},
+            "contentBlockIndex": 0,
+        }
+    },
+    {
+        "messageStop": {
+            "stopReason": "end_turn",
+        }
+    },
+)
 
-        # Message stop
-        yield {
-            "messageStop": {
-                "stopReason": "end_turn",
-            }
+_BEDROCK_EMPTY_EVENTS = (
+    {
+        "messageStop": {
+            "stopReason": "end_turn",
+        }
+    },
+)
+
+_BEDROCK_ERROR_EVENTS = (
+    {
+        "error": {
+            "message": "Stream processing error",
+            "code": "InternalError",
         }
+    },
+)
 
-    return {"stream": stream_generator()}
+
+def mock_bedrock_stream_response() -> dict:
+    """
+    Create a mock Bedrock converse_stream response.
+
+    Returns:
+        Mock response dict with stream events
+    """
+    return {"stream": _BEDROCK_STREAM_EVENTS}
 
 
 def mock_bedrock_single_chunk() -> dict:
@@ -77,21 +104,7 @@ def mock_bedrock_single_chunk() -> dict:
     Returns:
         Mock response dict
     """
-
-    def stream_generator():
-        yield {
-            "contentBlockDelta": {
-                "delta": {"text": "Complete response"},
-                "contentBlockIndex": 0,
-            }
-        }
-        yield {
-            "messageStop": {
-                "stopReason": "end_turn",
-            }
-        }
-
-    return {"stream": stream_generator()}
+    return {"stream": _BEDROCK_SINGLE_CHUNK_EVENTS}
 
 
 def mock_bedrock_empty_response() -> dict:
@@ -101,15 +114,7 @@ def mock_bedrock_empty_response() -> dict:
     Returns:
         Mock response dict
     """
-
-    def stream_generator():
-        yield {
-            "messageStop": {
-                "stopReason": "end_turn",
-            }
-        }
-
-    return {"stream": stream_generator()}
+    return {"stream": _BEDROCK_EMPTY_EVENTS}
 
 
 def mock_bedrock_error_response() -> dict:
@@ -119,13 +124,4 @@ def mock_bedrock_error_response() -> dict:
     Returns:
         Mock response dict with error
     """
-
-    def stream_generator():
-        yield {
-            "error": {
-                "message": "Stream processing error",
-                "code": "InternalError",
-            }
-        }
-
-    return {"stream": stream_generator()}
+    return {"stream": _BEDROCK_ERROR_EVENTS}
@@ -1,6 +1,17 @@
 """Mock OpenAI API responses for testing."""
 
 import json
+from typing import Optional
+
+import httpx
+
+# Serialized chunk with only the delta and finish_reason varying; matches
+# json.dumps output for the equivalent dict.
+_SSE_CHUNK_TEMPLATE = (
+    'data: {"id": "chatcmpl-test", "object": "chat.completion.chunk", '
+    '"created": 1234567890, "model": "test-model", '
+    '"choices": [{"index": 0, "delta": %s, "finish_reason": %s}]}\n\n'
+)
 
 
 def create_sse_chunk(content: str, finish_reason: str | None = None) -> str:
@@ -14,21 +25,8 @@ def create_sse_chunk(content: str, finish_reason: str | None = None) -> str:
     Returns:
         SSE formatted string
     """
-    chunk = {
-        "id": "chatcmpl-test",
-        "object": "chat.completion.chunk",
-        "created": 1234567890,
-        "model": "test-model",
-        "choices": [
-            {
-                "index": 0,
-                "delta": {"content": content} if content else {},
-                "finish_reason": finish_reason,
-            }
-        ],
-    }
-
-    return f"data: {json.dumps(chunk)}\n\n"
+    delta = f'{{"content": {json.dumps(content)}}}' if content else "{}"
+    return _SSE_CHUNK_TEMPLATE % (delta, json.dumps(finish_reason))
 
 
 def create_sse_done_marker() -> str:
@@ -57,6 +55,36 @@ def mock_streaming_response() -> list[str]:
     ]
 
 
+def mock_streaming_body() -> bytes:
+    """
+    Create the mock streaming response as a raw HTTP body.
+
+    Returns:
+        UTF-8 encoded SSE stream
+    """
+    return "".join(mock_streaming_response()).encode()
+
+
+def mock_sse_transport(body: bytes, url: Optional[str] = None) -> httpx.MockTransport:
+    """
+    Create an in-memory transport that serves an SSE body for every request.
+
+    Args:
+        body: Raw SSE response body
+        url: Optional URL every request is expected to target
+
+    Returns:
+        Transport to pass to OpenAICompatibleProvider
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if url is not None:
+            assert request.url == url
+        return httpx.Response(200, content=body)
+
+    return httpx.MockTransport(handler)
+
+
 def mock_single_chunk_response() -> list[str]:
     """
     Create a mock response with a single chunk.
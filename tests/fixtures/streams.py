@@ -0,0 +1,18 @@
+"""Helpers for consuming async streams in tests."""
+
+from typing import AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+
+async def drain(stream: AsyncIterator[T]) -> list[T]:
+    """
+    Consume an async iterator into a list.
+
+    Args:
+        stream: Async iterator to exhaust
+
+    Returns:
+        List of every item the iterator yielded
+    """
+    return [item async for item in stream]
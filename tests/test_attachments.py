@@ -1,5 +1,7 @@
 """Unit tests for attachment handling."""
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 
@@ -156,6 +158,19 @@ def test_attachment_to_data_url():
     assert data_url == "data:text/plain;base64,SGVsbG8="
 
 
+def test_attachment_encodings_cached():
+    """Base64 and data URL are encoded once and reused."""
+    attachment = create_attachment_from_bytes(b"Hello", "test.txt", "text/plain", "document")
+
+    assert attachment.to_base64() is attachment.to_base64()
+    assert attachment.to_data_url() is attachment.to_data_url()
+    assert [f.name for f in dataclasses.fields(attachment)] == [
+        "filename", "mime_type", "data", "attachment_type",
+    ]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        attachment.data = b"changed"  # type: ignore[misc]
+
+
 def test_attachment_size_properties():
     """Size properties calculated correctly."""
     # 1MB = 1024 * 1024 bytes
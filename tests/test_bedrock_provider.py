@@ -3,7 +3,7 @@
 import pytest
 from botocore.exceptions import ClientError, NoCredentialsError
 from pydantic import ValidationError
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch
 
 from ai_chat.config.models import ModelConfig, ProviderType
 from ai_chat.providers import (
@@ -20,9 +20,44 @@ from tests.fixtures.bedrock_responses import (
     mock_bedrock_empty_response,
     mock_bedrock_error_response,
 )
+from tests.fixtures.streams import drain
 
+pytestmark = pytest.mark.usefixtures("boto3_default_session")
 
-@pytest.fixture
+# Read-only conversation shared by the streaming tests
+_DEFAULT_MESSAGES = (Message(role="user", content="Hello"),)
+
+# Multi-turn conversation and its expected converse API form
+_CONVERSATION = (
+    Message(role="user", content="Hello"),
+    Message(role="assistant", content="Hi there!"),
+    Message(role="user", content="How are you?"),
+)
+_EXPECTED_BEDROCK_MESSAGES = [
+    {"role": "user", "content": [{"text": "Hello"}]},
+    {"role": "assistant", "content": [{"text": "Hi there!"}]},
+    {"role": "user", "content": [{"text": "How are you?"}]},
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def boto3_client():
+    """Patch boto3.client once for the whole module."""
+    patcher = patch("boto3.client")
+    mock_boto_client = patcher.start()
+    yield mock_boto_client
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def reset_boto3_client(boto3_client):
+    """Clear calls and side effects recorded by the previous test."""
+    yield
+    boto3_client.reset_mock(side_effect=True)
+    boto3_client.return_value.reset_mock(side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def bedrock_model_config():
     """Create a test model config for Bedrock provider."""
     return ModelConfig(
@@ -35,174 +70,96 @@ def bedrock_model_config():
     )
 
 
-@pytest.fixture
-def provider(bedrock_model_config):
-    """Create provider instance with mocked boto3 client."""
-    with patch("boto3.client") as mock_boto_client:
-        mock_client = Mock()
-        mock_boto_client.return_value = mock_client
-        provider = BedrockProvider(bedrock_model_config)
-        provider.client = mock_client
-        yield provider
+@pytest.fixture(scope="module")
+def provider(bedrock_model_config, boto3_client):
+    """Create provider instance with the module's mocked boto3 client."""
+    return BedrockProvider(bedrock_model_config)
 
 
 @pytest.mark.asyncio
 async def test_stream_chat_success(provider):
     """Provider correctly parses Bedrock stream into StreamChunks."""
-    messages = [Message(role="user", content="Hello")]
-
     # Mock Bedrock response
     mock_response = mock_bedrock_stream_response()
     provider.client.converse_stream = Mock(return_value=mock_response)
 
-    chunks = []
-    async for chunk in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-        chunks.append(chunk)
+    chunks = await drain(provider.stream_chat(_DEFAULT_MESSAGES, max_tokens=100, temperature=0.7))
 
     # Should receive chunks with content
     assert len(chunks) > 0
-    content = "".join(c.content for c in chunks if c.content)
+    content = "".join([c.content for c in chunks if c.content])
     assert content == "Hello from Bedrock!"
 
     # Last chunk should be done marker
     assert chunks[-1].done
 
 
+@pytest.mark.parametrize(
+    "error_code,error_message,expected_error,expected_text",
+    [
+        (
+            "UnrecognizedClientException",
+            "The security token included in the request is invalid.",
+            AuthenticationError,
+            "authentication failed",
+        ),
+        ("ThrottlingException", "Rate exceeded", RateLimitError, "rate limit"),
+        (
+            "AccessDeniedException",
+            "User is not authorized to perform action",
+            AuthenticationError,
+            "access denied",
+        ),
+        ("InternalServerError", "Internal server error", ProviderError, "bedrock error"),
+    ],
+    ids=["auth_error", "throttling", "access_denied", "generic_error"],
+)
 @pytest.mark.asyncio
-async def test_stream_chat_auth_error(provider):
-    """Authentication error raises clear exception."""
-    messages = [Message(role="user", content="Hello")]
-
-    # Mock authentication error
-    error_response = {
-        "Error": {
-            "Code": "UnrecognizedClientException",
-            "Message": "The security token included in the request is invalid.",
-        }
-    }
-    provider.client.converse_stream = Mock(
-        side_effect=ClientError(error_response, "converse_stream")
-    )
-
-    with pytest.raises(AuthenticationError) as exc_info:
-        async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            pass
-
-    assert "authentication failed" in str(exc_info.value).lower()
-
-
-@pytest.mark.asyncio
-async def test_stream_chat_throttling(provider):
-    """Throttling error handled with appropriate message."""
-    messages = [Message(role="user", content="Hello")]
-
-    # Mock throttling error
-    error_response = {
-        "Error": {
-            "Code": "ThrottlingException",
-            "Message": "Rate exceeded",
-        }
-    }
-    provider.client.converse_stream = Mock(
-        side_effect=ClientError(error_response, "converse_stream")
-    )
-
-    with pytest.raises(RateLimitError) as exc_info:
-        async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            pass
-
-    assert "rate limit" in str(exc_info.value).lower()
-
-
-@pytest.mark.asyncio
-async def test_stream_chat_access_denied(provider):
-    """Access denied error raises AuthenticationError."""
-    messages = [Message(role="user", content="Hello")]
-
-    # Mock access denied error
-    error_response = {
-        "Error": {
-            "Code": "AccessDeniedException",
-            "Message": "User is not authorized to perform action",
-        }
-    }
-    provider.client.converse_stream = Mock(
-        side_effect=ClientError(error_response, "converse_stream")
-    )
-
-    with pytest.raises(AuthenticationError) as exc_info:
-        async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            pass
-
-    assert "access denied" in str(exc_info.value).lower()
-
-
-@pytest.mark.asyncio
-async def test_stream_chat_generic_error(provider):
-    """Generic Bedrock error raises ProviderError."""
-    messages = [Message(role="user", content="Hello")]
-
-    # Mock generic error
+async def test_stream_chat_client_error(
+    provider, error_code, error_message, expected_error, expected_text
+):
+    """Bedrock client errors map to the matching provider exception."""
     error_response = {
         "Error": {
-            "Code": "InternalServerError",
-            "Message": "Internal server error",
+            "Code": error_code,
+            "Message": error_message,
         }
     }
     provider.client.converse_stream = Mock(
         side_effect=ClientError(error_response, "converse_stream")
     )
 
-    with pytest.raises(ProviderError) as exc_info:
-        async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            pass
+    with pytest.raises(expected_error) as exc_info:
+        await drain(provider.stream_chat(_DEFAULT_MESSAGES, max_tokens=100, temperature=0.7))
 
-    assert "bedrock error" in str(exc_info.value).lower()
+    assert expected_text in str(exc_info.value).lower()
 
 
 @pytest.mark.asyncio
 async def test_stream_error_event(provider):
     """Error events in stream raise ProviderError."""
-    messages = [Message(role="user", content="Hello")]
-
     # Mock response with error event
     mock_response = mock_bedrock_error_response()
     provider.client.converse_stream = Mock(return_value=mock_response)
 
     with pytest.raises(ProviderError) as exc_info:
-        async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            pass
+        await drain(provider.stream_chat(_DEFAULT_MESSAGES, max_tokens=100, temperature=0.7))
 
     assert "stream error" in str(exc_info.value).lower()
 
 
 def test_message_to_bedrock_format(provider):
     """Messages converted to Bedrock converse API format."""
-    messages = [
-        Message(role="user", content="Hello"),
-        Message(role="assistant", content="Hi there!"),
-        Message(role="user", content="How are you?"),
-    ]
-
-    bedrock_messages = provider._convert_messages(messages)
-
-    assert len(bedrock_messages) == 3
-    assert bedrock_messages[0]["role"] == "user"
-    assert bedrock_messages[0]["content"][0]["text"] == "Hello"
-    assert bedrock_messages[1]["role"] == "assistant"
-    assert bedrock_messages[1]["content"][0]["text"] == "Hi there!"
-    assert bedrock_messages[2]["role"] == "user"
-    assert bedrock_messages[2]["content"][0]["text"] == "How are you?"
-
-
-def test_supports_feature_images(provider):
-    """Claude models support images."""
-    assert provider.supports_feature("images")
+    assert provider._convert_messages(_CONVERSATION) == _EXPECTED_BEDROCK_MESSAGES
 
 
-def test_supports_feature_documents(provider):
-    """Claude models support documents."""
-    assert provider.supports_feature("documents")
+@pytest.mark.parametrize(
+    "feature,expected",
+    [("images", True), ("documents", True), ("unknown_feature", False)],
+)
+def test_supports_feature(provider, feature, expected):
+    """Claude models support images and documents, not unknown features."""
+    assert provider.supports_feature(feature) is expected
 
 
 def test_supports_feature_reasoning():
@@ -214,14 +171,8 @@ def test_supports_feature_reasoning():
         region="us-east-1",
     )
 
-    with patch("boto3.client"):
-        provider = BedrockProvider(config)
-        assert provider.supports_feature("reasoning")
-
-
-def test_supports_feature_unknown(provider):
-    """Unknown feature returns False."""
-    assert not provider.supports_feature("unknown_feature")
+    provider = BedrockProvider(config)
+    assert provider.supports_feature("reasoning")
 
 
 def test_missing_model_id():
@@ -233,13 +184,12 @@ def test_missing_model_id():
             region="us-east-1",
             # Missing model_id
         )
-        with patch("boto3.client"):
-            BedrockProvider(config)
+        BedrockProvider(config)
 
     assert "model_id" in str(exc_info.value).lower()
 
 
-def test_region_fallback():
+def test_region_fallback(boto3_client):
     """Provider uses default region when not specified."""
     config = ModelConfig(
         provider=ProviderType.BEDROCK,
@@ -248,28 +198,22 @@ def test_region_fallback():
         # No region specified
     )
 
-    with patch("boto3.client") as mock_boto_client:
-        provider = BedrockProvider(config)
+    provider = BedrockProvider(config)
 
-        # Should use default region
-        assert provider.region == "us-east-1"
-        mock_boto_client.assert_called_once_with(
-            "bedrock-runtime",
-            region_name="us-east-1",
-        )
+    # Should use default region
+    assert provider.region == "us-east-1"
+    boto3_client.assert_called_once_with(
+        "bedrock-runtime",
+        region_name="us-east-1",
+    )
 
 
-def test_credentials_error():
+def test_credentials_error(bedrock_model_config, boto3_client):
     """No credentials error raises AuthenticationError."""
-    config = ModelConfig(
-        provider=ProviderType.BEDROCK,
-        name="Test",
-        model_id="anthropic.claude-3-5-sonnet-20241022-v2:0",
-        region="us-east-1",
-    )
+    # Side effect is cleared by reset_boto3_client after the test
+    boto3_client.side_effect = NoCredentialsError()
 
-    with patch("boto3.client", side_effect=NoCredentialsError()):
-        with pytest.raises(AuthenticationError) as exc_info:
-            BedrockProvider(config)
+    with pytest.raises(AuthenticationError) as exc_info:
+        BedrockProvider(bedrock_model_config)
 
-        assert "credentials not configured" in str(exc_info.value).lower()
+    assert "credentials not configured" in str(exc_info.value).lower()
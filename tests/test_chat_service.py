@@ -1,22 +1,30 @@
 """Unit tests for chat service."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
 
-from ai_chat.config import Config
-from ai_chat.providers import Message, StreamChunk
+from ai_chat.providers import StreamChunk
 from ai_chat.services import ChatService
+from tests.fixtures.streams import drain
 
 
-@pytest.fixture
-def chat_service(valid_config_toml, tmp_config_dir, write_config_file):
-    """Create chat service with test config."""
-    config_file = write_config_file(valid_config_toml)
+class StubProvider:
+    """Provider stub that streams canned chunks, then optionally raises."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
 
-    from ai_chat.config import load_config
+    async def stream_chat(self, *args, **kwargs):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
 
-    config = load_config(str(config_file))
-    return ChatService(config)
+
+@pytest.fixture
+def chat_service(valid_config):
+    """Create chat service with test config."""
+    return ChatService(valid_config)
 
 
 def test_add_message_to_history(chat_service):
@@ -88,61 +96,49 @@ def test_get_current_model_name(chat_service):
 
 
 @pytest.mark.asyncio
-async def test_stream_delegates_to_provider(chat_service):
+async def test_stream_delegates_to_provider(valid_config):
     """Service delegates streaming to provider."""
-    # Mock provider
-    mock_provider = AsyncMock()
-
-    async def mock_stream(*args, **kwargs):
-        yield StreamChunk(content="Hello")
-        yield StreamChunk(content=" world")
-        yield StreamChunk(done=True)
-
-    mock_provider.stream_chat = mock_stream
-
-    # Patch provider creation
-    with patch.object(chat_service, "_create_provider", return_value=mock_provider):
-        chunks = []
-        async for chunk in chat_service.stream_response("Test message"):
-            chunks.append(chunk)
-
-        # Should have received chunks
-        assert len(chunks) == 3
-        content = "".join(c.content for c in chunks if c.content)
-        assert content == "Hello world"
-
-        # User message should be in history
-        assert chat_service.message_count == 2  # user + assistant
-        history = chat_service.get_history()
-        assert history[0].role == "user"
-        assert history[0].content == "Test message"
-        assert history[1].role == "assistant"
-        assert history[1].content == "Hello world"
+    stub_provider = StubProvider(
+        [
+            StreamChunk(content="Hello"),
+            StreamChunk(content=" world"),
+            StreamChunk(done=True),
+        ]
+    )
+    chat_service = ChatService(valid_config, provider_factory=lambda _: stub_provider)
+
+    chunks = await drain(chat_service.stream_response("Test message"))
+
+    # Should have received chunks
+    assert len(chunks) == 3
+    content = "".join([c.content for c in chunks if c.content])
+    assert content == "Hello world"
+
+    # User message should be in history
+    assert chat_service.message_count == 2  # user + assistant
+    history = chat_service.get_history()
+    assert history[0].role == "user"
+    assert history[0].content == "Test message"
+    assert history[1].role == "assistant"
+    assert history[1].content == "Hello world"
 
 
 @pytest.mark.asyncio
-async def test_stream_error_handling(chat_service):
+async def test_stream_error_handling(valid_config):
     """Errors during streaming don't corrupt history."""
+    # Provider that raises error after the first chunk
+    stub_provider = StubProvider(
+        [StreamChunk(content="Start")], error=Exception("Test error")
+    )
+    chat_service = ChatService(valid_config, provider_factory=lambda _: stub_provider)
     initial_count = chat_service.message_count
 
-    # Mock provider that raises error
-    mock_provider = AsyncMock()
+    with pytest.raises(Exception) as exc_info:
+        await drain(chat_service.stream_response("Test"))
 
-    async def mock_stream(*args, **kwargs):
-        yield StreamChunk(content="Start")
-        raise Exception("Test error")
+    assert "Test error" in str(exc_info.value)
 
-    mock_provider.stream_chat = mock_stream
-
-    # Patch provider creation
-    with patch.object(chat_service, "_create_provider", return_value=mock_provider):
-        with pytest.raises(Exception) as exc_info:
-            async for chunk in chat_service.stream_response("Test"):
-                pass
-
-        assert "Test error" in str(exc_info.value)
-
-        # User message added, but no assistant message (since it failed)
-        assert chat_service.message_count == initial_count + 1
-        history = chat_service.get_history()
-        assert history[-1].role == "user"
+    # User message added, but no assistant message (since it failed)
+    assert chat_service.message_count == initial_count + 1
+    history = chat_service.get_history()
+    assert history[-1].role == "user"
@@ -1,81 +1,63 @@
 """Unit tests for clipboard utilities."""
 
 import pytest
-
-from ai_chat.utils.clipboard import copy_to_clipboard, get_clipboard_text
-
-
-def test_copy_to_clipboard(qtbot):
-    """Text copied to system clipboard."""
-    test_text = "Hello, clipboard!"
-
-    result = copy_to_clipboard(test_text)
-
-    assert result is True
-    # Verify by reading back
-    clipboard_text = get_clipboard_text()
-    assert clipboard_text == test_text
-
-
-def test_copy_empty_string(qtbot):
-    """Empty string handled gracefully."""
-    result = copy_to_clipboard("")
-
-    assert result is True
-    clipboard_text = get_clipboard_text()
-    assert clipboard_text == ""
-
-
-def test_copy_multiline(qtbot):
-    """Multiline content preserved."""
-    multiline_text = """Line 1
-Line 2
-Line 3"""
-
-    result = copy_to_clipboard(multiline_text)
-
-    assert result is True
-    clipboard_text = get_clipboard_text()
-    assert clipboard_text == multiline_text
-
-
-def test_copy_unicode(qtbot):
-    """Unicode characters preserved."""
-    unicode_text = "Hello 世界 🌍"
-
-    result = copy_to_clipboard(unicode_text)
+from PyQt6.QtGui import QGuiApplication
+
+from ai_chat.utils.clipboard import (
+    _get_clipboard,
+    copy_to_clipboard,
+    get_clipboard_text,
+)
+
+# The system clipboard is shared between processes, so keep these tests on a
+# single xdist worker (requires --dist loadgroup)
+pytestmark = pytest.mark.xdist_group("clipboard")
+
+
+@pytest.fixture(scope="session")
+def qt_clipboard(qapp):
+    """Application clipboard, looked up once per session."""
+    return QGuiApplication.clipboard()
+
+
+@pytest.fixture(autouse=True)
+def clear_clipboard(qt_clipboard):
+    """Start each test with an empty clipboard."""
+    qt_clipboard.clear()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Hello, clipboard!",
+        "",
+        "Line 1\nLine 2\nLine 3",
+        "Hello 世界 🌍",
+        "A" * 10000,
+    ],
+    ids=["simple", "empty", "multiline", "unicode", "large"],
+)
+def test_copy_round_trip(qt_clipboard, text):
+    """Copied text reaches the system clipboard and reads back unchanged."""
+    result = copy_to_clipboard(text)
 
     assert result is True
-    clipboard_text = get_clipboard_text()
-    assert clipboard_text == unicode_text
+    assert qt_clipboard.text() == text
+    assert get_clipboard_text() == text
 
 
-def test_copy_large_text(qtbot):
-    """Large text copied successfully."""
-    large_text = "A" * 10000
+def test_get_clipboard_text(qt_clipboard):
+    """Text set through Qt is returned."""
+    qt_clipboard.setText("Set through Qt")
 
-    result = copy_to_clipboard(large_text)
-
-    assert result is True
-    clipboard_text = get_clipboard_text()
-    assert len(clipboard_text) == 10000
+    assert get_clipboard_text() == "Set through Qt"
 
 
-def test_get_clipboard_text_empty(qtbot):
+def test_get_clipboard_text_empty():
     """Get clipboard returns empty string when empty."""
-    # Clear clipboard first
-    copy_to_clipboard("")
-
-    text = get_clipboard_text()
-
-    assert text == ""
-
-
-def test_round_trip(qtbot):
-    """Copy and get operations work together."""
-    original = "Test round trip"
+    assert get_clipboard_text() == ""
 
-    copy_to_clipboard(original)
-    retrieved = get_clipboard_text()
 
-    assert retrieved == original
+def test_clipboard_reference_cached(qt_clipboard):
+    """Clipboard is looked up once and reused."""
+    assert _get_clipboard() is _get_clipboard() is qt_clipboard
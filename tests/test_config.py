@@ -11,9 +11,10 @@ from ai_chat.config import (
     LoggingConfig,
     load_config,
 )
+from ai_chat.config.loader import get_config_search_paths
 
 
-def test_load_valid_config(tmp_config_dir, valid_config_toml, write_config_file):
+def test_load_valid_config(valid_config_toml, write_config_file):
     """Config loads and validates correctly from valid TOML."""
     config_file = write_config_file(valid_config_toml)
 
@@ -25,7 +26,7 @@ def test_load_valid_config(tmp_config_dir, valid_config_toml, write_config_file)
     assert config.models["test-model"].provider == ProviderType.OPENAI_COMPATIBLE
 
 
-def test_load_invalid_provider_type(tmp_config_dir, write_config_file):
+def test_load_invalid_provider_type(write_config_file):
     """Invalid provider type raises ValidationError with clear message."""
     invalid_config = """
 [app]
@@ -44,7 +45,7 @@ name = "Test"
     assert "Invalid provider type" in str(exc_info.value)
 
 
-def test_load_missing_required_field(tmp_config_dir, write_config_file):
+def test_load_missing_required_field(write_config_file):
     """Missing required field raises ValidationError."""
     invalid_config = """
 [app]
@@ -64,21 +65,26 @@ name = "Test"
     assert "model_id" in str(exc_info.value).lower()
 
 
-def test_config_search_path_order(tmp_path, valid_config_toml, monkeypatch):
+def test_config_search_path_order(tmp_path, valid_config_toml):
     """Config loaded from correct path based on priority."""
-    # Create config in working directory
-    cwd_config = tmp_path / "config"
-    cwd_config.mkdir()
-    (cwd_config / "models.toml").write_text(valid_config_toml)
+    # Create config in a search directory
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "models.toml").write_text(valid_config_toml)
 
-    # Change to temp directory
-    monkeypatch.chdir(tmp_path)
-
-    # Should load from ./config/models.toml
-    config = load_config()
+    # Should load from <search dir>/models.toml
+    config = load_config(search_dirs=[tmp_path / "missing", config_dir])
     assert config.app.title == "Test AI Chat"
 
 
+def test_default_config_search_paths():
+    """Without search_dirs, ./config is searched before the user config dir."""
+    assert get_config_search_paths() == [
+        Path.cwd() / "config" / "models.toml",
+        Path.home() / ".config" / "ai-chat" / "models.toml",
+    ]
+
+
 def test_logging_config_defaults():
     """LoggingConfig uses sensible defaults when not specified."""
     logging_config = LoggingConfig()
@@ -88,7 +94,7 @@ def test_logging_config_defaults():
     assert "%(asctime)s" in logging_config.format
 
 
-def test_model_config_bedrock_fields(bedrock_config_toml, tmp_config_dir, write_config_file):
+def test_model_config_bedrock_fields(bedrock_config_toml, write_config_file):
     """Bedrock model config requires model_id and region."""
     config_file = write_config_file(bedrock_config_toml)
     config = load_config(str(config_file))
@@ -99,18 +105,15 @@ def test_model_config_bedrock_fields(bedrock_config_toml, tmp_config_dir, write_
     assert bedrock_model.region == "us-east-1"
 
 
-def test_model_config_openai_fields(valid_config_toml, tmp_config_dir, write_config_file):
+def test_model_config_openai_fields(valid_config):
     """OpenAI-compatible config requires base_url and model."""
-    config_file = write_config_file(valid_config_toml)
-    config = load_config(str(config_file))
-
-    openai_model = config.models["test-model"]
+    openai_model = valid_config.models["test-model"]
     assert openai_model.provider == ProviderType.OPENAI_COMPATIBLE
     assert openai_model.base_url == "http://localhost:11434/v1"
     assert openai_model.model == "test"
 
 
-def test_invalid_default_model(tmp_config_dir, write_config_file):
+def test_invalid_default_model(write_config_file):
     """Config validation fails when default_model doesn't exist."""
     invalid_config = """
 [app]
@@ -133,13 +136,11 @@ api_key = "test"
     assert "actual-model" in str(exc_info.value)
 
 
-def test_config_file_not_found(tmp_path, monkeypatch):
+def test_config_file_not_found(tmp_path):
     """FileNotFoundError raised when no config file found."""
-    # Change to a temp directory with no config
-    monkeypatch.chdir(tmp_path)
-
+    # Search only a directory with no config
     with pytest.raises(FileNotFoundError) as exc_info:
-        load_config("/nonexistent/path/to/config.toml")
+        load_config("/nonexistent/path/to/config.toml", search_dirs=[tmp_path / "config"])
 
     assert "No configuration file found" in str(exc_info.value)
 
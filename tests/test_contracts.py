@@ -1,7 +1,6 @@
 """Unit tests for contracts layer."""
 
 import pytest
-from datetime import datetime
 
 from ai_chat.contracts import (
     CapturePayload,
@@ -12,6 +11,14 @@ from ai_chat.contracts import (
     FormatHint,
 )
 
+FROZEN_NOW = "2024-01-01T00:00:00"
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the default provenance timestamp."""
+    monkeypatch.setattr("ai_chat.contracts.capture._default_now", lambda: FROZEN_NOW)
+
 
 class TestSourceType:
     """Tests for SourceType enum."""
@@ -48,7 +55,7 @@ class TestProvenance:
 
         assert provenance.source_id == "test_source"
         assert provenance.source_name == "Test Source"
-        assert isinstance(provenance.captured_at, str)
+        assert provenance.captured_at == FROZEN_NOW
         assert provenance.extra == {}
 
     def test_provenance_extra_field(self):
@@ -71,10 +78,12 @@ class TestProvenance:
 
         result = provenance.to_dict()
 
-        assert result["source_id"] == "test_source"
-        assert result["source_name"] == "Test Source"
-        assert "captured_at" in result
-        assert result["model"] == "claude-3"
+        assert result == {
+            "source_id": "test_source",
+            "source_name": "Test Source",
+            "captured_at": FROZEN_NOW,
+            "model": "claude-3",
+        }
 
     def test_provenance_custom_timestamp(self):
         """Provenance accepts custom timestamp."""
@@ -171,10 +180,16 @@ class TestCapturePayload:
 
         result = payload.to_markdown()
 
-        assert "---" in result  # YAML frontmatter delimiters
-        assert "source: Test Source" in result
-        assert "captured_at:" in result
-        assert "Test content" in result
+        assert result == (
+            "# Test Title\n"
+            "\n"
+            "---\n"
+            "source: Test Source\n"
+            f"captured_at: {FROZEN_NOW}\n"
+            "---\n"
+            "\n"
+            "Test content"
+        )
 
     def test_capture_payload_to_markdown_no_title(self):
         """CapturePayload to markdown works without title."""
@@ -16,58 +16,27 @@ from ai_chat.services.document import (
 )
 
 
-def test_detect_document_marker_html_comment():
-    """HTML comment marker detected correctly."""
-    text = """<!-- DOCUMENT: my-doc.md -->
-# My Document
-
-This is the content.
-"""
-    result = detect_document_marker(text)
-
-    assert result is not None
-    filename, content = result
-    assert filename == "my-doc.md"
-    assert "# My Document" in content
-    assert "This is the content" in content
-
-
-def test_detect_document_marker_fenced_block():
-    """Fenced code block with download detected."""
-    text = """Here's a document:
-
-```markdown download
-# Generated Document
-
-Some content here.
-```
-
-That's the document."""
-
-    result = detect_document_marker(text)
-
-    assert result is not None
-    filename, content = result
-    assert filename.endswith(".md")
-    assert "# Generated Document" in content
-    assert "Some content here" in content
-
-
-def test_detect_document_marker_case_insensitive():
-    """Marker detection is case insensitive."""
-    text = "<!-- document: FILE.MD -->Content"
-    result = detect_document_marker(text)
-
-    assert result is not None
-    assert result[0] == "FILE.MD"
-
-
-def test_no_document_marker():
-    """Text without markers returns None."""
-    text = "Just some regular text without any document markers."
-    result = detect_document_marker(text)
-
-    assert result is None
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        (
+            "<!-- DOCUMENT: my-doc.md -->\n# My Document\n\nThis is the content.\n",
+            ("my-doc.md", "# My Document\n\nThis is the content."),
+        ),
+        (
+            "Here's a document:\n\n"
+            "```markdown download\n# Generated Document\n\nSome content here.\n```\n\n"
+            "That's the document.",
+            ("generated-document.md", "# Generated Document\n\nSome content here."),
+        ),
+        ("<!-- document: FILE.MD -->Content", ("FILE.MD", "Content")),
+        ("Just some regular text without any document markers.", None),
+    ],
+    ids=["html_comment", "fenced_block", "case_insensitive", "no_marker"],
+)
+def test_detect_document_marker(text, expected):
+    """Markers are detected with their filename and content; plain text is not."""
+    assert detect_document_marker(text) == expected
 
 
 def test_extract_document_content_with_marker():
@@ -232,18 +201,19 @@ def test_document_content_without_metadata():
     assert content == "# Test\n\nContent"
 
 
-def test_save_document(tmp_path):
+def test_save_document():
     """Document saved correctly."""
     document = GeneratedDocument(
         content="# Test Document\n\nThis is a test.",
         filename="test.md",
     )
 
-    output_path = tmp_path / "test.md"
-    save_document(document, output_path)
+    written = {}
+    output_path = Path("docs") / "test.md"
+    save_document(document, output_path, writer=written.__setitem__)
 
-    assert output_path.exists()
-    content = output_path.read_text()
+    assert list(written) == [output_path]
+    content = written[output_path]
     assert "# Test Document" in content
     assert "This is a test" in content
 
@@ -262,7 +232,7 @@ def test_save_document_creates_directories(tmp_path):
     assert output_path.parent.exists()
 
 
-def test_save_document_with_metadata(tmp_path):
+def test_save_document_with_metadata():
     """Document with metadata saved correctly."""
     document = GeneratedDocument(
         content="# Test",
@@ -270,27 +240,24 @@ def test_save_document_with_metadata(tmp_path):
         metadata={"title": "Test", "author": "TestBot"},
     )
 
-    output_path = tmp_path / "test.md"
-    save_document(document, output_path)
+    written = {}
+    output_path = Path("docs") / "test.md"
+    save_document(document, output_path, writer=written.__setitem__)
 
-    content = output_path.read_text()
+    content = written[output_path]
     assert "---" in content
     assert "title: Test" in content
     assert "# Test" in content
 
 
-def test_can_generate_document_true():
-    """Returns true when document marker present."""
-    text = "<!-- DOCUMENT: test.md -->\nContent"
-
-    assert can_generate_document(text) is True
-
-
-def test_can_generate_document_false():
-    """Returns false when no marker."""
-    text = "Just regular text"
-
-    assert can_generate_document(text) is False
+@pytest.mark.parametrize(
+    "text,expected",
+    [("<!-- DOCUMENT: test.md -->\nContent", True), ("Just regular text", False)],
+    ids=["marker", "no_marker"],
+)
+def test_can_generate_document(text, expected):
+    """Reports whether a document marker is present."""
+    assert can_generate_document(text) is expected
 
 
 def test_generated_document_defaults():
@@ -0,0 +1,60 @@
+"""Unit tests for logging setup."""
+
+import logging
+import time
+
+import pytest
+
+from ai_chat.config import LoggingConfig
+from ai_chat.utils.logging import _stop_queue_listener, setup_logging
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log file path; root logger handlers and level are restored afterwards."""
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+    yield tmp_path / "logs" / "app.log"
+    _stop_queue_listener()
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def _wait_for(path, text, timeout=2.0):
+    """Poll until the background listener has written text to path."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and text in path.read_text():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_warning_flushed_without_shutdown(log_file):
+    """A WARNING reaches the file while logging is still running."""
+    setup_logging(LoggingConfig(file=str(log_file)))
+
+    logging.getLogger("ai_chat.test").warning("disk almost full")
+
+    assert _wait_for(log_file, "disk almost full")
+
+
+def test_warning_flushed_on_stop(log_file):
+    """Stopping the listener writes out queued and buffered records."""
+    setup_logging(LoggingConfig(file=str(log_file)))
+
+    logging.getLogger("ai_chat.test").warning("before stop")
+    _stop_queue_listener()
+
+    assert "before stop" in log_file.read_text()
+
+
+def test_warning_flushed_on_reconfigure(log_file):
+    """Running setup again flushes records from the previous configuration."""
+    setup_logging(LoggingConfig(file=str(log_file)))
+
+    logging.getLogger("ai_chat.test").warning("before reconfigure")
+    setup_logging(LoggingConfig(file=str(log_file)))
+
+    assert "before reconfigure" in log_file.read_text()
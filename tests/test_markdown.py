@@ -3,33 +3,65 @@
 import pytest
 
 from ai_chat.utils.markdown import (
+    CodeBlockProcessor,
+    _get_markdown,
     render_markdown,
     strip_markdown,
     get_pygments_css,
 )
 
-
-def test_render_headers():
-    """H1-H6 headers render as correct HTML tags."""
-    markdown = """# Header 1
+# Markdown snippets rendered once per module by the rendered_html fixture
+_MD_CASES = {
+    "headers": """# Header 1
 ## Header 2
-### Header 3"""
+### Header 3""",
+    "code_block_with_language": """```python
+def hello():
+    print("Hello, World!")
+```""",
+    "code_block_escapes": """```python
+if a < b and c & d:
+    pass
+```""",
+    "code_block_no_language": """```
+plain text code
+no highlighting
+```""",
+    "inline_code": "This is `inline code` in text.",
+    "lists": """- Item 1
+- Item 2
+- Item 3
 
-    html = render_markdown(markdown)
+1. First
+2. Second
+3. Third""",
+    "tables": """| Header 1 | Header 2 |
+|----------|----------|
+| Cell 1   | Cell 2   |
+| Cell 3   | Cell 4   |""",
+    "links": "[Click here](https://example.com)",
+    "bold_italic": "**bold text** and *italic text* and ***both***",
+}
+
+
+@pytest.fixture(scope="module")
+def rendered_html():
+    """Render every markdown case once (shared, treat as read-only)."""
+    return {name: render_markdown(source) for name, source in _MD_CASES.items()}
+
+
+def test_render_headers(rendered_html):
+    """H1-H6 headers render as correct HTML tags."""
+    html = rendered_html["headers"]
 
     assert "<h1>Header 1</h1>" in html
     assert "<h2>Header 2</h2>" in html
     assert "<h3>Header 3</h3>" in html
 
 
-def test_render_code_block_with_language():
+def test_render_code_block_with_language(rendered_html):
     """Fenced code block with language gets syntax highlighting."""
-    markdown = """```python
-def hello():
-    print("Hello, World!")
-```"""
-
-    html = render_markdown(markdown)
+    html = rendered_html["code_block_with_language"]
 
     # Should contain code block
     assert "hello" in html
@@ -38,40 +70,44 @@ def hello():
     assert "highlight" in html.lower()
 
 
-def test_render_code_block_no_language():
-    """Fenced code block without language renders as code."""
-    markdown = """```
-plain text code
-no highlighting
-```"""
+def test_render_code_block_escapes_once(rendered_html):
+    """Special characters in code blocks are escaped exactly once."""
+    html = rendered_html["code_block_escapes"]
 
-    html = render_markdown(markdown)
+    assert "&lt;" in html
+    assert "&amp;" in html
+    assert "&amp;lt;" not in html
+    assert "&amp;amp;" not in html
+
+
+def test_code_block_processor_shares_formatter():
+    """Processors for the same theme reuse one cached formatter."""
+    first = CodeBlockProcessor(theme="monokai")
+    second = CodeBlockProcessor(theme="monokai")
+
+    assert first.formatter is second.formatter
+    assert CodeBlockProcessor(theme="default").formatter is not first.formatter
+
+
+def test_render_code_block_no_language(rendered_html):
+    """Fenced code block without language renders as code."""
+    html = rendered_html["code_block_no_language"]
 
     assert "plain text code" in html
     assert "no highlighting" in html
 
 
-def test_render_inline_code():
+def test_render_inline_code(rendered_html):
     """Inline `code` renders correctly."""
-    markdown = "This is `inline code` in text."
-
-    html = render_markdown(markdown)
+    html = rendered_html["inline_code"]
 
     assert "<code>" in html
     assert "inline code" in html
 
 
-def test_render_lists():
+def test_render_lists(rendered_html):
     """Ordered and unordered lists render correctly."""
-    markdown = """- Item 1
-- Item 2
-- Item 3
-
-1. First
-2. Second
-3. Third"""
-
-    html = render_markdown(markdown)
+    html = rendered_html["lists"]
 
     assert "<ul>" in html
     assert "<li>Item 1</li>" in html
@@ -79,14 +115,9 @@ def test_render_lists():
     assert "<li>First</li>" in html
 
 
-def test_render_tables():
+def test_render_tables(rendered_html):
     """Markdown tables render as HTML tables."""
-    markdown = """| Header 1 | Header 2 |
-|----------|----------|
-| Cell 1   | Cell 2   |
-| Cell 3   | Cell 4   |"""
-
-    html = render_markdown(markdown)
+    html = rendered_html["tables"]
 
     assert "<table>" in html
     assert "<thead>" in html
@@ -95,22 +126,18 @@ def test_render_tables():
     assert "Cell 1" in html
 
 
-def test_render_links():
+def test_render_links(rendered_html):
     """Links render as clickable anchors."""
-    markdown = "[Click here](https://example.com)"
-
-    html = render_markdown(markdown)
+    html = rendered_html["links"]
 
     assert "<a" in html
     assert 'href="https://example.com"' in html
     assert "Click here" in html
 
 
-def test_render_bold_italic():
+def test_render_bold_italic(rendered_html):
     """Bold and italic formatting renders correctly."""
-    markdown = "**bold text** and *italic text* and ***both***"
-
-    html = render_markdown(markdown)
+    html = rendered_html["bold_italic"]
 
     assert "<strong>bold text</strong>" in html
     assert "<em>italic text</em>" in html
@@ -130,6 +157,38 @@ def test_render_plain_text():
     assert "Just plain text" in html
 
 
+def test_render_plain_text_matches_markdown_output():
+    """Plain single-line text renders as a single paragraph."""
+    assert render_markdown("Just plain text") == "<p>Just plain text</p>"
+    assert render_markdown("  Leading spaces, trailing dot.") == "<p>Leading spaces, trailing dot.</p>"
+
+
+def test_render_plain_text_quotes_match_markdown():
+    """Quotes in plain text render exactly as the full Markdown path does."""
+    text = 'It\'s a "quoted" sentence'
+
+    assert render_markdown(text) == _get_markdown().reset().convert(text)
+    assert render_markdown(text) == '<p>It\'s a "quoted" sentence</p>'
+
+
+def test_render_plain_text_edge_cases_use_markdown():
+    """Text that only looks plain still goes through markdown."""
+    assert "<pre>" in render_markdown("    indented code")
+    assert "<li>" in render_markdown("- list item")
+    assert "<hr />" in render_markdown("- - -")
+
+
+def test_render_does_not_leak_between_calls():
+    """Consecutive renders don't carry over state from earlier documents."""
+    first = render_markdown("# First\n\n```python\nx = 1\n```")
+    second = render_markdown("Second *message*")
+
+    assert "First" in first
+    assert "First" not in second
+    assert "highlight" not in second
+    assert "<em>message</em>" in second
+
+
 def test_strip_markdown_headers():
     """Strip markdown removes header markers."""
     markdown = "# Header"
@@ -186,6 +245,33 @@ code here
     assert "code here" in plain
 
 
+def test_strip_markdown_nested_and_images():
+    """Strip markdown handles nested emphasis and drops images."""
+    markdown = "**bold _and italic_** ![logo](logo.png)[docs](https://example.com)"
+    plain = strip_markdown(markdown)
+
+    assert plain == "bold and italic docs"
+
+
+@pytest.mark.parametrize(
+    "markdown,expected",
+    [
+        ("Use *# of items* here", "Use # of items here"),
+        ("**# Note** text", "# Note text"),
+    ],
+)
+def test_strip_markdown_keeps_hash_inside_emphasis(markdown, expected):
+    """A '#' inside emphasis is text, not a header marker."""
+    assert strip_markdown(markdown) == expected
+
+
+def test_strip_markdown_headers_only_at_line_starts():
+    """Header markers are removed on every line but kept inside inline markup."""
+    markdown = "Intro *text*\n## Section\nSee [# 5](https://example.com) and **#tag**"
+
+    assert strip_markdown(markdown) == "Intro text\nSection\nSee # 5 and #tag"
+
+
 def test_get_pygments_css_dark():
     """Pygments CSS generates for dark theme."""
     css = get_pygments_css("monokai")
@@ -200,3 +286,8 @@ def test_get_pygments_css_light():
 
     assert len(css) > 0
     assert ".highlight" in css
+
+
+def test_get_pygments_css_cached():
+    """Repeated CSS lookups for a theme return the cached string."""
+    assert get_pygments_css("monokai") is get_pygments_css("monokai")
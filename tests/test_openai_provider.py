@@ -1,7 +1,9 @@
 """Unit tests for OpenAI-compatible provider."""
 
+import json
+
+import httpx
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
 from pydantic import ValidationError
 
 from ai_chat.config.models import ModelConfig, ProviderType
@@ -13,14 +15,11 @@ from ai_chat.providers import (
     RateLimitError,
 )
 from ai_chat.providers.openai_compatible import OpenAICompatibleProvider
-from tests.fixtures.openai_responses import (
-    create_sse_chunk,
-    create_sse_done_marker,
-    mock_streaming_response,
-)
+from tests.fixtures.openai_responses import mock_streaming_body
+from tests.fixtures.streams import drain
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def openai_model_config():
     """Create a test model config for OpenAI-compatible provider."""
     return ModelConfig(
@@ -34,151 +33,111 @@ def openai_model_config():
     )
 
 
-@pytest.fixture
-def provider(openai_model_config):
-    """Create provider instance."""
-    return OpenAICompatibleProvider(openai_model_config)
+@pytest.fixture(scope="module")
+def mock_transport():
+    """In-memory transport standing in for the OpenAI-compatible server."""
+    return httpx.MockTransport(_handle_request)
 
 
-class MockResponse:
-    """Mock httpx Response for testing."""
+@pytest.fixture(scope="module")
+def provider(openai_model_config, mock_transport):
+    """Create provider instance (shared, treat as read-only)."""
+    return OpenAICompatibleProvider(openai_model_config, transport=mock_transport)
 
-    def __init__(self, status_code=200, lines=None):
-        self.status_code = status_code
-        self._lines = lines or []
 
-    async def aiter_lines(self):
-        """Async iterator for lines."""
-        for line in self._lines:
-            yield line
+# Canned SSE response body served for successful requests
+_SSE_BODY = mock_streaming_body()
 
-    async def aread(self):
-        """Read response body."""
-        return b"Error message"
+# Read-only conversation for tests that expect a successful stream
+_DEFAULT_MESSAGES = (Message(role="user", content="Hello"),)
 
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, *args):
-        pass
+# Multi-turn conversation and its expected OpenAI API form
+_CONVERSATION = (
+    Message(role="user", content="Hello"),
+    Message(role="assistant", content="Hi there!"),
+    Message(role="user", content="How are you?"),
+)
+_EXPECTED_OPENAI_MESSAGES = [
+    {"role": "user", "content": "Hello"},
+    {"role": "assistant", "content": "Hi there!"},
+    {"role": "user", "content": "How are you?"},
+]
+
+
+def _handle_request(request: httpx.Request) -> httpx.Response:
+    """
+    Simulate the upstream server, keyed on the last message's content.
+
+    "connect_error" and "timeout" raise the matching httpx error, a numeric
+    status code returns that error status, anything else streams the canned
+    SSE body.
+    """
+    scenario = json.loads(request.content)["messages"][-1]["content"]
+    if scenario == "connect_error":
+        raise httpx.ConnectError("Connection refused", request=request)
+    if scenario == "timeout":
+        raise httpx.TimeoutException("Request timeout", request=request)
+    if scenario.isdigit():
+        return httpx.Response(int(scenario), content=b"Error message")
+    return httpx.Response(200, content=_SSE_BODY)
 
 
 @pytest.mark.asyncio
 async def test_stream_chat_success(provider):
     """Provider correctly parses SSE stream into StreamChunks."""
-    messages = [Message(role="user", content="Hello")]
-
-    # Mock httpx client
-    mock_response = MockResponse(lines=mock_streaming_response())
-
-    def mock_stream(*args, **kwargs):
-        return mock_response
-
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.stream = mock_stream
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        chunks = []
-        async for chunk in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-            chunks.append(chunk)
+    chunks = await drain(
+        provider.stream_chat(_DEFAULT_MESSAGES, max_tokens=100, temperature=0.7)
+    )
 
-        # Should receive chunks with content
-        assert len(chunks) > 0
-        content = "".join(c.content for c in chunks if c.content)
-        assert content == "Hello world!"
+    # Should receive chunks with content
+    assert len(chunks) > 0
+    content = "".join([c.content for c in chunks if c.content])
+    assert content == "Hello world!"
 
-        # Last chunk should be done marker
-        assert chunks[-1].done
+    # Last chunk should be done marker
+    assert chunks[-1].done
 
 
 @pytest.mark.asyncio
 async def test_stream_chat_connection_error(provider):
     """Connection error raises appropriate exception with message."""
-    import httpx
-
-    messages = [Message(role="user", content="Hello")]
-
-    def mock_stream(*args, **kwargs):
-        raise httpx.ConnectError("Connection refused")
-
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.stream = mock_stream
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+    messages = [Message(role="user", content="connect_error")]
 
-        with pytest.raises(ConnectionError) as exc_info:
-            async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-                pass
+    with pytest.raises(ConnectionError) as exc_info:
+        await drain(provider.stream_chat(messages, max_tokens=100, temperature=0.7))
 
-        assert "Cannot connect" in str(exc_info.value)
-        assert provider.config.name in str(exc_info.value)
+    assert "Cannot connect" in str(exc_info.value)
+    assert provider.config.name in str(exc_info.value)
 
 
 @pytest.mark.asyncio
 async def test_stream_chat_timeout(provider):
     """Request timeout handled gracefully."""
-    import httpx
+    messages = [Message(role="user", content="timeout")]
 
-    messages = [Message(role="user", content="Hello")]
+    with pytest.raises(ConnectionError) as exc_info:
+        await drain(provider.stream_chat(messages, max_tokens=100, temperature=0.7))
 
-    def mock_stream(*args, **kwargs):
-        raise httpx.TimeoutException("Request timeout")
-
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.stream = mock_stream
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        with pytest.raises(ConnectionError) as exc_info:
-            async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-                pass
-
-        assert "timed out" in str(exc_info.value).lower()
-
-
-@pytest.mark.asyncio
-async def test_stream_chat_auth_error(provider):
-    """Authentication error raises clear exception."""
-    messages = [Message(role="user", content="Hello")]
-
-    mock_response = MockResponse(status_code=401)
-
-    def mock_stream(*args, **kwargs):
-        return mock_response
-
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.stream = mock_stream
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-                pass
-
-        assert "Authentication failed" in str(exc_info.value)
+    assert "timed out" in str(exc_info.value).lower()
 
 
+@pytest.mark.parametrize(
+    "status,expected_error,expected_text",
+    [
+        (401, AuthenticationError, "Authentication failed"),
+        (429, RateLimitError, "Rate limit"),
+        (500, ProviderError, "HTTP 500"),
+    ],
+)
 @pytest.mark.asyncio
-async def test_stream_chat_rate_limit(provider):
-    """Rate limit error raised when server returns 429."""
-    messages = [Message(role="user", content="Hello")]
+async def test_stream_chat_http_errors(provider, status, expected_error, expected_text):
+    """HTTP error statuses raise the matching provider exception."""
+    messages = [Message(role="user", content=str(status))]
 
-    mock_response = MockResponse(status_code=429)
+    with pytest.raises(expected_error) as exc_info:
+        await drain(provider.stream_chat(messages, max_tokens=100, temperature=0.7))
 
-    def mock_stream(*args, **kwargs):
-        return mock_response
-
-    with patch("httpx.AsyncClient") as mock_client_class:
-        mock_client = AsyncMock()
-        mock_client.stream = mock_stream
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-
-        with pytest.raises(RateLimitError) as exc_info:
-            async for _ in provider.stream_chat(messages, max_tokens=100, temperature=0.7):
-                pass
-
-        assert "Rate limit" in str(exc_info.value)
+    assert expected_text in str(exc_info.value)
 
 
 def test_parse_sse_data_line():
@@ -195,29 +154,15 @@ def test_parse_sse_done_marker():
 
 def test_message_format_conversion(provider):
     """Messages converted to OpenAI API format correctly."""
-    messages = [
-        Message(role="user", content="Hello"),
-        Message(role="assistant", content="Hi there!"),
-        Message(role="user", content="How are you?"),
-    ]
-
-    openai_messages = provider._convert_messages(messages)
+    assert provider._convert_messages(_CONVERSATION) == _EXPECTED_OPENAI_MESSAGES
 
-    assert len(openai_messages) == 3
-    assert openai_messages[0] == {"role": "user", "content": "Hello"}
-    assert openai_messages[1] == {"role": "assistant", "content": "Hi there!"}
-    assert openai_messages[2] == {"role": "user", "content": "How are you?"}
 
-
-def test_supports_feature(provider):
-    """Provider correctly reports feature support."""
-    # Default config has no special features
-    assert not provider.supports_feature("images")
-    assert not provider.supports_feature("documents")
-    assert not provider.supports_feature("reasoning")
-
-    # Unknown feature
-    assert not provider.supports_feature("unknown_feature")
+@pytest.mark.parametrize(
+    "feature", ["images", "documents", "reasoning", "unknown_feature"]
+)
+def test_supports_feature(provider, feature):
+    """Default config reports no optional features."""
+    assert provider.supports_feature(feature) is False
 
 
 def test_missing_base_url():
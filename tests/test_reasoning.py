@@ -10,37 +10,36 @@ from ai_chat.utils.reasoning import (
 )
 
 
-def test_extract_think_tags():
-    """<think> tags extracted correctly."""
-    text = "Let me think about this. <think>Step 1: analyze\nStep 2: conclude</think> The answer is 42."
-
-    reasoning, cleaned = extract_reasoning_tags(text)
-
-    assert reasoning == "Step 1: analyze\nStep 2: conclude"
-    assert "<think>" not in cleaned
-    assert "</think>" not in cleaned
-    assert "The answer is 42" in cleaned
-
-
-def test_extract_reasoning_tags():
-    """<reasoning> tags extracted correctly."""
-    text = "Before answering: <reasoning>First consider X, then Y</reasoning> Final answer."
-
-    reasoning, cleaned = extract_reasoning_tags(text)
-
-    assert reasoning == "First consider X, then Y"
-    assert "<reasoning>" not in cleaned
-    assert "Final answer" in cleaned
-
-
-def test_extract_thought_tags():
-    """<thought> tags extracted correctly."""
-    text = "<thought>Internal monologue here</thought>External response"
-
+@pytest.mark.parametrize(
+    "text,expected_reasoning,expected_answer",
+    [
+        pytest.param(
+            "Let me think about this. <think>Step 1: analyze\nStep 2: conclude</think> The answer is 42.",
+            "Step 1: analyze\nStep 2: conclude",
+            "The answer is 42",
+            id="think",
+        ),
+        pytest.param(
+            "Before answering: <reasoning>First consider X, then Y</reasoning> Final answer.",
+            "First consider X, then Y",
+            "Final answer",
+            id="reasoning",
+        ),
+        pytest.param(
+            "<thought>Internal monologue here</thought>External response",
+            "Internal monologue here",
+            "External response",
+            id="thought",
+        ),
+    ],
+)
+def test_extract_tags(text, expected_reasoning, expected_answer):
+    """Each supported tag format is extracted and removed from the answer."""
     reasoning, cleaned = extract_reasoning_tags(text)
 
-    assert reasoning == "Internal monologue here"
-    assert "External response" in cleaned
+    assert reasoning == expected_reasoning
+    assert "<" not in cleaned
+    assert expected_answer in cleaned
 
 
 def test_no_reasoning_tags():
@@ -53,6 +52,12 @@ def test_no_reasoning_tags():
     assert cleaned == text
 
 
+def test_no_reasoning_tags_still_strips_whitespace():
+    """Untagged text is trimmed the same way as tagged text."""
+    assert extract_reasoning_tags("  plain answer \n") == (None, "plain answer")
+    assert extract_reasoning_tags("") == (None, "")
+
+
 def test_nested_content_preserved():
     """Nested content within tags preserved."""
     text = "<think>Line 1\n\nLine 2 with **markdown**\n\nLine 3</think>Response"
@@ -75,21 +80,24 @@ def test_case_insensitive():
     assert "result" in cleaned
 
 
-def test_has_reasoning_tags_think():
-    """Detect <think> tags."""
-    assert has_reasoning_tags("<think>content</think>")
-    assert has_reasoning_tags("prefix <think>content</think> suffix")
-    assert not has_reasoning_tags("no tags here")
-
-
-def test_has_reasoning_tags_reasoning():
-    """Detect <reasoning> tags."""
-    assert has_reasoning_tags("<reasoning>content</reasoning>")
+@pytest.mark.parametrize(
+    "text",
+    [
+        "<think>content</think>",
+        "prefix <think>content</think> suffix",
+        "<reasoning>content</reasoning>",
+        "<thought>content</thought>",
+    ],
+)
+def test_has_reasoning_tags(text):
+    """Every supported tag format is detected."""
+    assert has_reasoning_tags(text)
 
 
-def test_has_reasoning_tags_thought():
-    """Detect <thought> tags."""
-    assert has_reasoning_tags("<thought>content</thought>")
+@pytest.mark.parametrize("text", ["no tags here", "a < b and b > c", ""])
+def test_has_reasoning_tags_absent(text):
+    """Text without reasoning tags is not flagged."""
+    assert not has_reasoning_tags(text)
 
 
 def test_count_tokens_approximate():
@@ -131,6 +139,16 @@ def test_format_reasoning_for_display_long():
     assert "..." in formatted["preview"]
 
 
+def test_format_reasoning_for_display_trims_preview_only():
+    """Trailing whitespace at the cut point is dropped from the preview."""
+    reasoning = "word " * 40
+
+    formatted = format_reasoning_for_display(reasoning, max_preview_length=10)
+
+    assert formatted["preview"] == "word word..."
+    assert formatted["full_text"] is reasoning
+
+
 def test_multiple_tags_only_first_extracted():
     """Only first tag set extracted."""
     text = "<think>First</think> middle <think>Second</think> end"
@@ -150,3 +168,31 @@ def test_whitespace_handling():
 
     assert reasoning == "reasoning"
     assert cleaned == "response"
+
+
+def test_first_block_of_any_tag_extracted():
+    """Earliest reasoning block wins regardless of tag type."""
+    text = "<reasoning>Plan</reasoning> <think>Later</think> answer"
+
+    reasoning, cleaned = extract_reasoning_tags(text)
+
+    assert reasoning == "Plan"
+    assert cleaned == "answer"
+
+
+def test_unclosed_tags_do_not_match():
+    """Many unclosed tags are rejected without rescanning the whole text."""
+    text = "<think>step " * 20000 + "</reasoning>"
+
+    reasoning, cleaned = extract_reasoning_tags(text)
+
+    assert reasoning is None
+    assert cleaned == text.strip()
+
+
+def test_repeated_opening_tag_uses_innermost_block():
+    """A block starts at the last opening tag before its closing tag."""
+    reasoning, cleaned = extract_reasoning_tags("<think>draft <think>final</think> answer")
+
+    assert reasoning == "final"
+    assert cleaned == "<think>draft  answer"
@@ -1,11 +1,11 @@
 """Unit tests for AIChatSource plugin."""
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from pathlib import Path
 
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QTextCursor
 
 from ai_chat.source import AIChatSource
 from ai_chat.contracts import (
@@ -26,6 +26,46 @@ def mock_context():
     )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _patched_source_deps():
+    """Patch config loading and ChatWidget once for the whole module."""
+    with patch("ai_chat.source.load_config") as load_config, patch("ai_chat.source.ChatWidget") as chat_widget:
+        yield load_config, chat_widget
+
+
+@pytest.fixture
+def mock_load_config(_patched_source_deps):
+    """Module-wide load_config patch, reset for each test."""
+    load_config = _patched_source_deps[0]
+    load_config.reset_mock(return_value=True)
+    return load_config
+
+
+@pytest.fixture
+def mock_chat_widget(_patched_source_deps):
+    """Module-wide ChatWidget patch, reset for each test."""
+    chat_widget = _patched_source_deps[1]
+    chat_widget.reset_mock(return_value=True)
+    return chat_widget
+
+
+@pytest.fixture
+def widget_factory():
+    """Build a stub ChatWidget exposing only what the capture methods read."""
+    def make(selected_text="", last_assistant=None, message_count=0, model="test-model"):
+        cursor = SimpleNamespace(selectedText=lambda: selected_text)
+        return SimpleNamespace(
+            chat_display=SimpleNamespace(
+                text_browser=SimpleNamespace(textCursor=lambda: cursor),
+                get_last_assistant_message=lambda: last_assistant,
+                message_count=message_count,
+            ),
+            chat_service=SimpleNamespace(get_current_model_name=lambda: model),
+        )
+
+    return make
+
+
 @pytest.fixture
 def source():
     """Create an AIChatSource instance."""
@@ -58,13 +98,20 @@ class TestAIChatSourceProperties:
         assert caps["supports_streaming"] is False
         assert caps["supports_attachments"] is False
 
+    def test_capabilities_returns_independent_dict(self, source):
+        """Each access returns a plain dict; changing it doesn't leak."""
+        caps = source.capabilities
+        caps["supports_streaming"] = True
+
+        assert type(caps) is dict
+        assert source.capabilities["supports_streaming"] is False
+        assert AIChatSource().capabilities["supports_streaming"] is False
+
 
 class TestAIChatSourceWidget:
     """Tests for widget creation."""
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
-    def test_create_widget_returns_qwidget(self, mock_chat_widget, mock_load_config, source, mock_context, qtbot):
+    def test_create_widget_returns_qwidget(self, mock_chat_widget, mock_load_config, source, mock_context):
         """create_widget returns a QWidget instance."""
         # Setup mocks
         mock_config = Mock()
@@ -83,8 +130,6 @@ class TestAIChatSourceWidget:
         )
         assert widget == mock_widget_instance
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
     def test_create_widget_stores_context(self, mock_chat_widget, mock_load_config, source, mock_context):
         """Context stored for later use."""
         # Setup mocks
@@ -104,21 +149,14 @@ class TestAIChatSourceWidget:
 class TestAIChatSourceSelection:
     """Tests for get_selection method."""
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
-    def test_get_selection_no_selection(self, mock_chat_widget, mock_load_config, source, mock_context):
+    def test_get_selection_no_selection(self, mock_chat_widget, mock_load_config, source, mock_context, widget_factory):
         """get_selection returns None when nothing selected."""
         # Setup mocks
         mock_config = Mock()
         mock_load_config.return_value = mock_config
 
-        # Create mock widget with no selection
-        mock_widget = Mock()
-        mock_text_cursor = Mock(spec=QTextCursor)
-        mock_text_cursor.selectedText.return_value = ""
-        mock_widget.chat_display.text_browser.textCursor.return_value = mock_text_cursor
-        mock_widget.chat_service.get_current_model_name.return_value = "test-model"
-        mock_chat_widget.return_value = mock_widget
+        # Create stub widget with no selection
+        mock_chat_widget.return_value = widget_factory()
 
         # Create widget and try to get selection
         source.create_widget(mock_context)
@@ -126,21 +164,14 @@ class TestAIChatSourceSelection:
 
         assert result is None
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
-    def test_get_selection_with_selection(self, mock_chat_widget, mock_load_config, source, mock_context):
+    def test_get_selection_with_selection(self, mock_chat_widget, mock_load_config, source, mock_context, widget_factory):
         """get_selection returns CapturePayload with selected text."""
         # Setup mocks
         mock_config = Mock()
         mock_load_config.return_value = mock_config
 
-        # Create mock widget with selection
-        mock_widget = Mock()
-        mock_text_cursor = Mock(spec=QTextCursor)
-        mock_text_cursor.selectedText.return_value = "Selected text content"
-        mock_widget.chat_display.text_browser.textCursor.return_value = mock_text_cursor
-        mock_widget.chat_service.get_current_model_name.return_value = "test-model"
-        mock_chat_widget.return_value = mock_widget
+        # Create stub widget with selection
+        mock_chat_widget.return_value = widget_factory(selected_text="Selected text content")
 
         # Create widget and get selection
         source.create_widget(mock_context)
@@ -167,18 +198,14 @@ class TestAIChatSourceSelection:
 class TestAIChatSourceFullCapture:
     """Tests for get_full_capture method."""
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
-    def test_get_full_capture_no_response(self, mock_chat_widget, mock_load_config, source, mock_context):
+    def test_get_full_capture_no_response(self, mock_chat_widget, mock_load_config, source, mock_context, widget_factory):
         """get_full_capture returns None when no AI response."""
         # Setup mocks
         mock_config = Mock()
         mock_load_config.return_value = mock_config
 
-        # Create mock widget with no response
-        mock_widget = Mock()
-        mock_widget.chat_display.get_last_assistant_message.return_value = None
-        mock_chat_widget.return_value = mock_widget
+        # Create stub widget with no response
+        mock_chat_widget.return_value = widget_factory()
 
         # Create widget and try to get full capture
         source.create_widget(mock_context)
@@ -186,20 +213,17 @@ class TestAIChatSourceFullCapture:
 
         assert result is None
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
-    def test_get_full_capture_with_response(self, mock_chat_widget, mock_load_config, source, mock_context):
+    def test_get_full_capture_with_response(self, mock_chat_widget, mock_load_config, source, mock_context, widget_factory):
         """get_full_capture returns last AI response as CapturePayload."""
         # Setup mocks
         mock_config = Mock()
         mock_load_config.return_value = mock_config
 
-        # Create mock widget with response
-        mock_widget = Mock()
-        mock_widget.chat_display.get_last_assistant_message.return_value = "# AI Response\n\nThis is the response."
-        mock_widget.chat_display.message_count = 5
-        mock_widget.chat_service.get_current_model_name.return_value = "test-model"
-        mock_chat_widget.return_value = mock_widget
+        # Create stub widget with response
+        mock_chat_widget.return_value = widget_factory(
+            last_assistant="# AI Response\n\nThis is the response.",
+            message_count=5,
+        )
 
         # Create widget and get full capture
         source.create_widget(mock_context)
@@ -226,8 +250,6 @@ class TestAIChatSourceFullCapture:
 class TestAIChatSourceShutdown:
     """Tests for shutdown method."""
 
-    @patch("ai_chat.source.load_config")
-    @patch("ai_chat.source.ChatWidget")
     def test_shutdown_clears_resources(self, mock_chat_widget, mock_load_config, source, mock_context):
         """shutdown clears widget and context."""
         # Setup mocks